@@ -0,0 +1,242 @@
+import os
+
+# O driver de vídeo precisa ser escolhido antes de o pygame ser importado
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT
+
+# =============================================
+# TEMPO DE QUADRO SEM JANELA (SDL DUMMY)
+# =============================================
+# Desenha quadros de cenários fixos com o mesmo código do jogo e mede o
+# tempo de cada um. Uso:
+#   python -m benchmarks.frame_times -o resultados.json
+#   python -m benchmarks.frame_times --baseline base.json --tolerance 0.10
+
+FRAMES = 300
+WARMUP_FRAMES = 20
+REPEAT = 3                    # Rodadas por cenário; vale a rodada mais rápida (como no timeit)
+SEED = 1234
+DIFFICULTY = 2
+TOLERANCE = 0.10              # Aumento relativo aceito antes de acusar regressão
+COMPARED_METRICS = ("p50_ms", "p95_ms")
+
+
+class FixedTrack:
+    """Fonte de pistas (interface de TrackPool) que sempre entrega a pista da semente."""
+
+    def __init__(self, seed):
+        self.seed = seed
+
+    def get(self, difficulty):
+        from game.track_cache import seeded_function
+        from game.track_pool import bake_track
+        return bake_track(seeded_function(self.seed, difficulty), difficulty)
+
+
+def _new_game(seed):
+    from game.game_state import GameState
+    return GameState(DIFFICULTY, pool=FixedTrack(seed))
+
+
+def _drive_to_checkpoint(game):
+    while not game.input_mode and not game.game_over:
+        game.update()
+    game.interpolate(1.0)
+
+
+def _play_to_victory(game):
+    while not game.game_over:
+        if game.input_mode:
+            game.input_text = repr(game.next_checkpoint["answer"])
+            game.check_answer()
+        else:
+            game.update()
+    game.interpolate(1.0)
+
+
+def scenario_driving(screen, seed):
+    """Carro andando: a cada quadro um passo de simulação e a tela inteira redesenhada."""
+    from ui.game_screen import GameScreen
+    game = _new_game(seed)
+    game_screen = GameScreen(screen)
+
+    def frame():
+        if game.input_mode:
+            game.input_text = repr(game.next_checkpoint["answer"])
+            game.check_answer()
+        if game.game_over:
+            game.reset()
+        game.update()
+        game.interpolate(1.0)
+        game_screen.draw_frame(game)
+    return frame
+
+
+def scenario_input(screen, seed):
+    """Parado no primeiro checkpoint com uma resposta sendo digitada."""
+    from ui.game_screen import GameScreen
+    game = _new_game(seed)
+    _drive_to_checkpoint(game)
+    game.input_text = "-1.25"
+    game_screen = GameScreen(screen)
+    return lambda: game_screen.draw_frame(game)
+
+
+def scenario_crash(screen, seed):
+    """Painel de fim de jogo após uma resposta errada."""
+    from ui.game_screen import GameScreen
+    game = _new_game(seed)
+    _drive_to_checkpoint(game)
+    game.input_text = repr(game.next_checkpoint["answer"] + 100)
+    game.check_answer()
+    game_screen = GameScreen(screen)
+    return lambda: game_screen.draw_frame(game)
+
+
+def scenario_victory(screen, seed):
+    """Tela final depois de responder todos os checkpoints."""
+    from ui.game_screen import GameScreen
+    game = _new_game(seed)
+    _play_to_victory(game)
+    game_screen = GameScreen(screen)
+    return lambda: game_screen.draw_frame(game)
+
+
+def scenario_menu(screen, seed):
+    """Menu principal com a curva animada."""
+    from ui.menu.main_menu import Menu
+    menu = Menu(screen)
+    return lambda: menu.draw_frame((0, 0))
+
+
+SCENARIOS = {
+    "driving": scenario_driving,
+    "input": scenario_input,
+    "crash": scenario_crash,
+    "victory": scenario_victory,
+    "menu": scenario_menu,
+}
+
+
+def measure(frame, frames=FRAMES, repeat=REPEAT, warmup=WARMUP_FRAMES):
+    """
+    Executa o quadro várias vezes e resume os tempos.
+
+    Cada rodada mede `frames` quadros; o resultado é o da rodada com menor
+    mediana, que é a menos afetada por outros processos na máquina.
+
+    Returns:
+        dict: Percentis e média em milissegundos
+    """
+    for _ in range(warmup):
+        frame()
+    rounds = []
+    for _ in range(repeat):
+        gc.collect()
+        times = np.empty(frames)
+        for i in range(frames):
+            start = time.perf_counter()
+            frame()
+            times[i] = time.perf_counter() - start
+        rounds.append(times * 1000)
+    times = min(rounds, key=np.median)
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "frames": frames,
+        "repeat": repeat,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "mean_ms": float(times.mean()),
+    }
+
+
+def run(scenarios=tuple(SCENARIOS), frames=FRAMES, seed=SEED, repeat=REPEAT):
+    """
+    Mede os cenários pedidos.
+
+    Returns:
+        dict: {"meta": ..., "scenarios": {nome: tempos}}
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    from ui.text_cache import init_fonts
+    init_fonts()
+
+    results = {}
+    for name in scenarios:
+        results[name] = measure(SCENARIOS[name](screen, seed), frames, repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "frames": frames,
+            "seed": seed,
+            "difficulty": DIFFICULTY,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE, metrics=COMPARED_METRICS):
+    """
+    Compara com resultados anteriores.
+
+    Returns:
+        list: Regressões encontradas, como (cenário, métrica, base, atual)
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        for metric in metrics:
+            if current[metric] > reference[metric] * (1 + tolerance):
+                regressions.append((name, metric, reference[metric], current[metric]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de quadro dos cenários do jogo sem janela.")
+    parser.add_argument("-o", "--output", help="arquivo JSON para os resultados")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="aumento relativo aceito (0.10 = 10%%)")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="quadros por rodada")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="rodadas por cenário")
+    parser.add_argument("--seed", type=int, default=SEED, help="número da pista usada nos cenários")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="cenário (repetível)")
+    args = parser.parse_args(argv)
+
+    results = run(args.scenario or tuple(SCENARIOS), args.frames, args.seed, args.repeat)
+    print(f"{'cenário':<10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, times in results["scenarios"].items():
+        print(f"{name:<10}{times['p50_ms']:>10.3f}{times['p95_ms']:>10.3f}{times['p99_ms']:>10.3f}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, metric, before, after in regressions:
+            print(f"REGRESSÃO {name} {metric}: {before:.3f} -> {after:.3f} ms ({after / before - 1:+.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import numpy as np
+from game.track import Track
+from utils.expression import compile_jet
+from utils.function_generator import FunctionGenerator
+
+# =============================================
+# DESEMPENHO DO GERADOR E DA AVALIAÇÃO DAS FUNÇÕES
+# =============================================
+# Mede a geração de funções, a avaliação escalar de f, f', f'' e a amostragem
+# das pistas. Cada medida repete exatamente o mesmo trabalho (mesma semente)
+# em várias rodadas e fica com a mais rápida, para que diferenças de ~10%
+# sejam distinguíveis do ruído. Uso:
+#   python -m benchmarks.function_generator -o gerador.json
+#   python -m benchmarks.function_generator --baseline gerador.json
+
+SEED = 1234
+REPEAT = 5
+GENERATE_CALLS = 20          # Chamadas de generate_function por rodada
+SET_SIZE = 10                # Funções por generate_function_set
+FUNCTIONS_PER_FAMILY = 10    # Funções avaliadas por família
+EVALUATION_POINTS = 1000     # Valores de x por função na avaliação escalar
+TOLERANCE = 0.10
+
+
+def _best(run, repeat):
+    """Menor tempo (em segundos) entre as rodadas de run()."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _result(seconds, operations):
+    return {
+        "us_per_op": seconds / operations * 1e6,
+        "ops_per_s": operations / seconds,
+        "ops": operations,
+    }
+
+
+def bench_generate(seed=SEED, repeat=REPEAT, calls=GENERATE_CALLS):
+    """Latência de generate_function por família e complexidade."""
+    results = {}
+    for family in FunctionGenerator().function_types:
+        for difficulty in (1, 2, 3):
+            def run():
+                generator = FunctionGenerator(seed)
+                for _ in range(calls):
+                    generator.generate_function(family, difficulty)
+            results[f"generate/{family}/{difficulty}"] = _result(_best(run, repeat), calls)
+    return results
+
+
+def bench_generate_set(seed=SEED, repeat=REPEAT, size=SET_SIZE):
+    """Vazão de generate_function_set (em funções por segundo)."""
+    def run():
+        FunctionGenerator(seed).generate_function_set(size, (1, 3))
+    return {"generate_set": _result(_best(run, repeat), size)}
+
+
+def _sample_functions(family, seed, count):
+    """Funções válidas da família pedida (sem a família de reserva de generate_function)."""
+    generator = FunctionGenerator(seed)
+    functions = []
+    while len(functions) < count:
+        candidate = generator._generate_candidate(family, 3)
+        jet_vec = compile_jet(candidate["expr"], vectorized=True)
+        if not generator.validate(jet_vec):
+            functions.append(generator._build_function(**candidate, jet_vec=jet_vec))
+    return functions
+
+
+def bench_evaluation(seed=SEED, repeat=REPEAT, count=FUNCTIONS_PER_FAMILY, points=EVALUATION_POINTS):
+    """Avaliações escalares por segundo de f, df e d2f, por família (complexidade 3)."""
+    xs = [float(x) for x in np.linspace(0, 1000, points)]
+    results = {}
+    for family in FunctionGenerator().function_types:
+        functions = _sample_functions(family, seed, count)
+        for key in ("f", "df", "d2f"):
+            evaluators = [func[key] for func in functions]
+
+            def run():
+                for evaluate in evaluators:
+                    for x in xs:
+                        evaluate(x)
+            results[f"eval/{family}/{key}"] = _result(_best(run, repeat), count * points)
+    return results
+
+
+def bench_track(seed=SEED, repeat=REPEAT, count=FUNCTIONS_PER_FAMILY):
+    """Tempo para amostrar a pista inteira (FUNC_RANGE) de cada família."""
+    results = {}
+    for family in FunctionGenerator().function_types:
+        functions = _sample_functions(family, seed, count)
+
+        def run():
+            for func in functions:
+                Track(func)
+        results[f"track/{family}"] = _result(_best(run, repeat), count)
+    return results
+
+
+BENCHMARKS = {
+    "generate": bench_generate,
+    "generate_set": bench_generate_set,
+    "eval": bench_evaluation,
+    "track": bench_track,
+}
+
+
+def run(groups=tuple(BENCHMARKS), seed=SEED, repeat=REPEAT):
+    """
+    Executa os grupos de medidas pedidos.
+
+    Returns:
+        dict: {"meta": ..., "benchmarks": {nome: {"us_per_op", "ops_per_s", "ops"}}}
+    """
+    results = {}
+    for group in groups:
+        results.update(BENCHMARKS[group](seed=seed, repeat=repeat))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """
+    Compara com resultados anteriores (tempo por operação).
+
+    Returns:
+        list: Regressões encontradas, como (nome, base, atual) em µs por operação
+    """
+    regressions = []
+    reference = baseline.get("benchmarks", {})
+    for name, current in results["benchmarks"].items():
+        if name in reference and current["us_per_op"] > reference[name]["us_per_op"] * (1 + tolerance):
+            regressions.append((name, reference[name]["us_per_op"], current["us_per_op"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o desempenho do gerador de funções.")
+    parser.add_argument("-o", "--output", help="arquivo JSON para os resultados")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="aumento relativo aceito (0.10 = 10%%)")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="rodadas por medida")
+    parser.add_argument("--group", action="append", choices=sorted(BENCHMARKS), help="grupo de medidas (repetível)")
+    args = parser.parse_args(argv)
+
+    results = run(args.group or tuple(BENCHMARKS), args.seed, args.repeat)
+    print(f"{'medida':<32}{'µs/op':>12}{'op/s':>14}")
+    for name, result in results["benchmarks"].items():
+        print(f"{name:<32}{result['us_per_op']:>12.2f}{result['ops_per_s']:>14.0f}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after in regressions:
+            print(f"REGRESSÃO {name}: {before:.2f} -> {after:.2f} µs/op ({after / before - 1:+.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
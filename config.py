@@ -1,8 +1,23 @@
+import os
 import pygame
 
 # Dimensões da tela
 WIDTH, HEIGHT = 1000, 600
 
+# Margem (em pixels) além das bordas da tela em que a pista ainda é desenhada
+TRACK_CULL_MARGIN = 20
+
+# Atualiza apenas as regiões alteradas da tela em vez de redesenhar tudo a cada quadro
+# (ativado com DERIVATIVE_DASH_DIRTY_RECTS=1)
+DIRTY_RECT_RENDERING = os.environ.get("DERIVATIVE_DASH_DIRTY_RECTS") == "1"
+
+# Número da pista fixa (ex.: a mesma pista para toda a turma); sem ele, cada
+# partida usa uma função nova (ativado com DERIVATIVE_DASH_TRACK=1234)
+TRACK_SEED = os.environ.get("DERIVATIVE_DASH_TRACK")
+
+# Limite de quadros por segundo do menu principal (a animação não precisa de 60)
+MENU_FPS = 30
+
 # Cores
 WHITE = (255, 255, 255)
 GRAY = (100, 100, 100)
@@ -1,11 +1,61 @@
 import math
+import threading
 from utils.function_generator import get_functions
 
 # =============================================
 # BIBLIOTECA DE FUNÇÕES PARA O JOGO
 # =============================================
-# Importa as funções do gerador
-FUNCTIONS = get_functions(include_static=True, generated_count=3, difficulty_range=(1, 3))
+# As funções são geradas sob demanda, na primeira vez que um conjunto é
+# pedido, e não na importação do módulo.
+
+# Complexidade das funções geradas para cada nível de dificuldade do jogo
+DIFFICULTY_RANGES = {
+    1: (1, 1),  # Fácil: funções mais simples
+    2: (1, 2),  # Normal
+    3: (2, 3),  # Difícil: funções mais complexas
+}
+
+# Número de funções geradas em cada conjunto (além das estáticas)
+GENERATED_COUNT = 3
+
+_function_sets = {}
+# O pool de pistas (game/track_pool.py) pede conjuntos de várias threads
+_function_sets_lock = threading.Lock()
+
+
+def get_function_set(difficulty, seed=None):
+    """
+    Retorna o conjunto de funções de uma dificuldade, gerando-o no primeiro pedido.
+
+    Os conjuntos ficam em cache por (dificuldade, semente); com a mesma
+    semente, o conjunto gerado é sempre o mesmo.
+
+    Args:
+        difficulty (int): Nível de dificuldade (1=Fácil, 2=Normal, 3=Difícil)
+        seed (int, optional): Semente do gerador
+
+    Returns:
+        list: Funções estáticas e geradas para a dificuldade
+    """
+    key = (difficulty, seed)
+    with _function_sets_lock:
+        if key not in _function_sets:
+            _function_sets[key] = get_functions(
+                include_static=True,
+                generated_count=GENERATED_COUNT,
+                difficulty_range=DIFFICULTY_RANGES[difficulty],
+                seed=seed,
+            )
+        return _function_sets[key]
+
+
+def __getattr__(name):
+    # Compatibilidade: FUNCTIONS (todas as dificuldades) também é criado só no primeiro acesso
+    if name == "FUNCTIONS":
+        functions = get_functions(include_static=True, generated_count=GENERATED_COUNT, difficulty_range=(1, 3))
+        globals()["FUNCTIONS"] = functions
+        return functions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 """
 STATIC_FUNCTIONS = [
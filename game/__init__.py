@@ -1,4 +1,13 @@
 # Game package
-from game.game_state import GameState
+from game.engine import GameEngine
 
-__all__ = ['GameState']
\ No newline at end of file
+__all__ = ['GameState', 'GameEngine']
+
+
+def __getattr__(name):
+    # GameState depende do pygame e só é importado quando usado, para que a
+    # simulação sem tela (game.engine, game.batch) não carregue a interface
+    if name == 'GameState':
+        from game.game_state import GameState
+        return GameState
+    raise AttributeError(f"module 'game' has no attribute {name!r}")
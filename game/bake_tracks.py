@@ -0,0 +1,142 @@
+import argparse
+import collections
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from game.track import layout_checkpoints
+from game.track_cache import seeded_function
+
+# =============================================
+# GERAÇÃO DE PISTAS EM LOTE (LISTAS E PROVAS)
+# =============================================
+# Gera fórmulas, posições dos checkpoints e respostas exatas de muitas pistas
+# em paralelo, gravando CSV ou JSONL à medida que os resultados chegam.
+# Uso: python -m game.bake_tracks --count 10000 --difficulty 2 --format csv -o pistas.csv
+#
+# A pista de número n é a mesma jogada com DERIVATIVE_DASH_TRACK=n.
+
+CHUNK_SIZE = 50          # Pistas por tarefa enviada a um processo
+IN_FLIGHT_PER_WORKER = 2  # Tarefas pendentes por processo (limita a memória)
+
+
+def bake_answers(track_number, difficulty):
+    """
+    Gera a pista de um número e calcula as respostas dos checkpoints.
+
+    Args:
+        track_number (int): Número da pista
+        difficulty (int): Nível de dificuldade do jogo (1-3)
+
+    Returns:
+        dict: Dados simples (serializáveis) da pista e de seus checkpoints
+    """
+    func = seeded_function(track_number, difficulty)
+    return {
+        "track": track_number,
+        "difficulty": difficulty,
+        "family": func["family"],
+        "name": func["name"],
+        "formula": func["formula"],
+        "checkpoints": layout_checkpoints(func, difficulty),
+    }
+
+
+def _bake_chunk(track_numbers, difficulty):
+    return [bake_answers(track_number, difficulty) for track_number in track_numbers]
+
+
+def bake_many(count, difficulty=2, start=0, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Gera pistas em paralelo, na ordem dos números, sem guardar todas na memória.
+
+    No máximo IN_FLIGHT_PER_WORKER tarefas por processo ficam pendentes; a
+    próxima só é enviada quando a mais antiga termina.
+
+    Args:
+        count (int): Número de pistas
+        difficulty (int): Nível de dificuldade do jogo (1-3)
+        start (int): Número da primeira pista
+        workers (int, optional): Processos (padrão: número de CPUs)
+        chunk_size (int): Pistas por tarefa
+
+    Yields:
+        dict: Resultado de bake_answers para cada pista
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = (
+        range(first, min(first + chunk_size, start + count))
+        for first in range(start, start + count, chunk_size)
+    )
+    pending = collections.deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(_bake_chunk, chunk, difficulty))
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _csv_row(result, checkpoint_count):
+    row = [result["track"], result["difficulty"], result["family"], result["name"], result["formula"]]
+    for checkpoint in result["checkpoints"][:checkpoint_count]:
+        row += [checkpoint["x"], checkpoint["type"], repr(checkpoint["answer"])]
+    return row
+
+
+def write_results(results, output, output_format, checkpoint_count=4):
+    """
+    Grava os resultados conforme chegam.
+
+    Args:
+        results (iterable): Resultados de bake_many
+        output (file): Arquivo de texto aberto para escrita
+        output_format (str): "csv" ou "jsonl"
+        checkpoint_count (int): Checkpoints por linha no CSV
+
+    Returns:
+        int: Número de pistas gravadas
+    """
+    written = 0
+    if output_format == "csv":
+        writer = csv.writer(output)
+        header = ["track", "difficulty", "family", "name", "formula"]
+        for i in range(1, checkpoint_count + 1):
+            header += [f"x{i}", f"type{i}", f"answer{i}"]
+        writer.writerow(header)
+        for result in results:
+            writer.writerow(_csv_row(result, checkpoint_count))
+            written += 1
+    else:
+        for result in results:
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            written += 1
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera pistas, checkpoints e respostas em lote.")
+    parser.add_argument("--count", type=int, default=1000, help="número de pistas")
+    parser.add_argument("--start", type=int, default=0, help="número da primeira pista")
+    parser.add_argument("--difficulty", type=int, default=2, choices=[1, 2, 3])
+    parser.add_argument("--format", default="jsonl", choices=["csv", "jsonl"])
+    parser.add_argument("-o", "--output", default="-", help="arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: número de CPUs)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = bake_many(args.count, args.difficulty, args.start, args.workers)
+    if args.output == "-":
+        written = write_results(results, sys.stdout, args.format)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            written = write_results(results, output, args.format)
+    elapsed = time.perf_counter() - start
+    print(f"{written} pistas em {elapsed:.2f}s ({written / elapsed:.0f}/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
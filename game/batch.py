@@ -0,0 +1,160 @@
+import argparse
+import json
+import random
+import time
+from game.engine import GameEngine
+from game.timestep import SimulatedClock
+
+# =============================================
+# SIMULAÇÃO DE PARTIDAS EM LOTE (SEM TELA)
+# =============================================
+# Uso: python -m game.batch --games 10000 --difficulty 2 --policy noisy
+#
+# Por padrão o carro anda SIM_SPEED vezes mais por passo que no jogo: a
+# pontuação não depende da velocidade (o carro para exatamente em cada
+# checkpoint), só o número de passos simulados. --sim-speed 1 simula o ritmo real.
+
+SIM_SPEED = 4.0
+
+
+def _real_value(game):
+    """Resposta exata para o checkpoint atual"""
+    return game.next_checkpoint["answer"]
+
+
+def _threshold(game):
+    if game.next_checkpoint["type"] == "first":
+        return game.error_threshold_first
+    return game.error_threshold_second
+
+
+def perfect_policy(game, rng):
+    """Sempre responde o valor exato."""
+    return _real_value(game)
+
+
+def noisy_policy(game, rng, spread=1.0):
+    """
+    Responde o valor exato com um erro normal cujo desvio padrão é
+    `spread` vezes a tolerância do checkpoint.
+    """
+    return _real_value(game) + rng.gauss(0, spread * _threshold(game))
+
+
+def wrong_policy(game, rng):
+    """Sempre erra por mais que a tolerância."""
+    return _real_value(game) + 2 * _threshold(game)
+
+
+def zero_policy(game, rng):
+    """Sempre responde 0 (chute comum de quem não sabe a resposta)."""
+    return 0
+
+
+POLICIES = {
+    "perfect": perfect_policy,
+    "noisy": noisy_policy,
+    "wrong": wrong_policy,
+    "zero": zero_policy,
+}
+
+
+def play_game(game, policy, rng, clock, max_steps=100000):
+    """
+    Joga uma partida até o fim, respondendo os checkpoints com a política.
+
+    Args:
+        game (GameEngine): Partida já reiniciada
+        policy (callable): policy(game, rng) -> resposta numérica
+        rng (random.Random): Gerador usado pela política
+        clock (SimulatedClock): Relógio injetado no jogo
+        max_steps (int): Limite de passos de simulação por partida
+
+    Returns:
+        int: Número de passos de simulação executados
+    """
+    steps = 0
+    while not game.game_over and steps < max_steps:
+        if game.input_mode:
+            game.input_text = str(policy(game, rng))
+            game.check_answer()
+        else:
+            game.update()
+            clock.tick()
+            steps += 1
+    return steps
+
+
+def run_batch(games, policy=perfect_policy, difficulty=2, seed=None, sim_speed=SIM_SPEED):
+    """
+    Simula várias partidas o mais rápido possível.
+
+    Args:
+        games (int): Número de partidas
+        policy (callable): Política de respostas (ver POLICIES)
+        difficulty (int): Nível de dificuldade (1-3)
+        seed (int, optional): Semente para reprodutibilidade
+        sim_speed (float): Distância por passo em relação ao jogo (ver GameEngine)
+
+    Returns:
+        dict: Estatísticas agregadas das partidas
+    """
+    rng = random.Random(seed)
+    clock = SimulatedClock()
+    game = GameEngine(difficulty, clock=clock, rng=rng, function_seed=seed, sim_speed=sim_speed)
+
+    victories = 0
+    crashes = 0
+    total_score = 0
+    total_steps = 0
+    checkpoints_passed = [0] * (game.TOTAL_CHECKPOINTS + 1)
+    scores_by_function = {}
+
+    start = time.perf_counter()
+    for i in range(games):
+        if i > 0:
+            game.reset()
+        total_steps += play_game(game, policy, rng, clock)
+
+        victories += game.victory
+        crashes += game.crashed
+        total_score += game.score
+        if game.checkpoints_passed < len(checkpoints_passed):
+            checkpoints_passed[game.checkpoints_passed] += 1
+        name = game.current_func["name"]
+        scores_by_function.setdefault(name, []).append(game.score)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "games": games,
+        "difficulty": difficulty,
+        "victories": victories,
+        "crashes": crashes,
+        "mean_score": total_score / games if games else 0.0,
+        "checkpoints_passed": checkpoints_passed,
+        "mean_score_by_function": {
+            name: sum(scores) / len(scores) for name, scores in scores_by_function.items()
+        },
+        "simulated_seconds": total_steps * clock.ms_per_step / 1000,
+        "sim_speed": sim_speed,
+        "elapsed": elapsed,
+        "games_per_second": games / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simula partidas de Derivative Dash sem tela.")
+    parser.add_argument("--games", type=int, default=1000, help="número de partidas")
+    parser.add_argument("--difficulty", type=int, default=2, choices=[1, 2, 3])
+    parser.add_argument("--policy", default="perfect", choices=sorted(POLICIES))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--sim-speed", type=float, default=SIM_SPEED,
+                        help="distância por passo em relação ao jogo (1 = ritmo real)")
+    args = parser.parse_args(argv)
+
+    result = run_batch(args.games, POLICIES[args.policy], args.difficulty, args.seed, args.sim_speed)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import random
+import time
+from game.track import Track, layout_checkpoints
+from functions import get_function_set
+from utils.tracing import traced, instant
+
+# Em paredes quase verticais, andar `speed` ao longo da curva quase não
+# avança em x; o carro sempre avança ao menos speed / MAX_ARC_PER_X em x por
+# passo, então nenhuma pista leva mais que MAX_ARC_PER_X vezes o tempo de
+# uma pista plana (só trechos com inclinação acima de ~4 ficam mais rápidos)
+MAX_ARC_PER_X = 4.0
+
+
+def monotonic_ms():
+    """Relógio padrão do motor: milissegundos de um relógio monotônico."""
+    return int(time.monotonic() * 1000)
+
+
+class GameEngine:
+    """
+    Lógica do jogo sem dependência da interface.
+
+    Não cria superfícies nem consulta o relógio da janela: o relógio é
+    injetado, o que permite simular partidas sem tela (ver game/batch.py).
+    """
+    def __init__(self, difficulty=2, clock=monotonic_ms, rng=random, pool=None, function_seed=None,
+                 sim_speed=1.0):
+        """
+        Inicializa o estado do jogo.
+        
+        Args:
+            difficulty (int): Nível de dificuldade (1=Fácil, 2=Normal, 3=Difícil)
+            clock (callable): Função sem argumentos que retorna o tempo atual em milissegundos
+            rng: Gerador usado para escolher a função (random.Random ou o módulo random)
+            pool (TrackPool, optional): Fonte de pistas prontas; sem pool, a função
+                é sorteada do conjunto da dificuldade e a pista preparada no reinício
+            function_seed (int, optional): Semente do conjunto de funções (ver functions.py)
+            sim_speed (float): Multiplica a distância percorrida por passo; o jogo
+                usa 1, simulações em lote podem usar mais para terminar em menos passos
+        """
+        self.difficulty = difficulty
+        self.clock = clock
+        self.rng = rng
+        self.pool = pool
+        self.function_seed = function_seed
+        self.sim_speed = sim_speed
+        self.reset()
+
+    @traced()
+    def reset(self):
+        """Reinicia o estado do jogo"""
+        # Configuração baseada na dificuldade
+        self._configure_difficulty()
+        
+        # Seleção aleatória de função (já preparada pelo pool, se houver)
+        if self.pool is not None:
+            baked = self.pool.get(self.difficulty)
+            self.current_func = baked["func"]
+            self.track = baked["track"]
+            self.checkpoints = baked["checkpoints"]
+        else:
+            self.current_func = self.rng.choice(get_function_set(self.difficulty, self.function_seed))
+            self.track = Track(self.current_func)
+            self.checkpoints = layout_checkpoints(self.current_func, self.difficulty)
+        self.f = self.current_func["f"]
+        self.df = self.current_func["df"]
+        self.d2f = self.current_func["d2f"]
+        self.FUNC_RANGE = self.current_func["range"]
+        self.TOTAL_CHECKPOINTS = self.current_func["checkpoints"]
+        self.TRACK_LENGTH = self.FUNC_RANGE[1] - self.FUNC_RANGE[0]
+
+        # Estado do carro e câmera
+        self.car_x = self.FUNC_RANGE[0] + 50
+        # Distância percorrida ao longo da curva: o carro anda `speed` por passo
+        # medido sobre a pista, não em x, para manter a velocidade visual constante
+        # (exceto nas paredes, ver MAX_ARC_PER_X)
+        self.car_s = self.track.arc_length_at(self.car_x)
+        self.camera_x = 0
+        self.camera_y = self.f(self.car_x) - 300  # HEIGHT//2
+        # Velocidade definida baseada na dificuldade em _configure_difficulty()
+        self.max_speed = 8.0
+        
+        # Estado do jogo
+        self.input_mode = False
+        self.input_text = ''
+        self.message = ''
+        self.message_time = 0
+        self.score = 0
+        self.game_over = False
+        self.crashed = False
+        self.victory = False
+        self.car_color = (50, 100, 200)  # BLUE
+        self.skid_marks = []
+        self.checkpoints_passed = 0
+        # Informações para explicação de erro
+        self.error_info = None
+        self.error_tip = ""
+
+        self.next_checkpoint = self.checkpoints[0]
+        self.waiting_at_checkpoint = False
+
+        # Regiões da tela alteradas desde o último quadro desenhado
+        self.message_visible = False
+        self.dirty_regions = {"all"}
+
+        # Posições do passo anterior e posições interpoladas usadas para desenhar
+        self._render_state = None
+        self._save_previous_state()
+        self.interpolate(1.0)
+
+    def mark_dirty(self, *regions):
+        """
+        Registra regiões da tela que precisam ser redesenhadas.
+
+        Regiões: "all" (tela inteira), "message" (mensagem abaixo do HUD) e
+        "input" (caixa de resposta). Enquanto o carro anda a câmera se move,
+        então o carro e a pista sempre marcam a tela inteira.
+        """
+        self.dirty_regions.update(regions)
+
+    def consume_dirty(self):
+        """Retorna e limpa o conjunto de regiões alteradas."""
+        dirty = self.dirty_regions
+        self.dirty_regions = set()
+        return dirty
+
+    def _save_previous_state(self):
+        self.prev_car_x = self.car_x
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
+
+    def interpolate(self, alpha):
+        """
+        Calcula as posições de desenho entre o passo anterior e o atual.
+
+        Args:
+            alpha (float): Fração (0 a 1) do intervalo entre os dois passos
+        """
+        render_car_x = self.prev_car_x + (self.car_x - self.prev_car_x) * alpha
+        render_camera_x = self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha
+        render_camera_y = self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha
+        if (render_car_x, render_camera_x, render_camera_y) != self._render_state:
+            self._render_state = (render_car_x, render_camera_x, render_camera_y)
+            self.mark_dirty("all")
+        self.render_car_x = render_car_x
+        self.render_camera_x = render_camera_x
+        self.render_camera_y = render_camera_y
+
+    def type_text(self, text):
+        """Acrescenta texto à resposta sendo digitada."""
+        self.input_text += text
+        self.mark_dirty("input")
+
+    def erase_text(self):
+        """Apaga o último caractere da resposta sendo digitada."""
+        self.input_text = self.input_text[:-1]
+        self.mark_dirty("input")
+
+    def _configure_difficulty(self):
+        """Configura os parâmetros do jogo baseados na dificuldade"""
+        if self.difficulty == 1:  # Fácil
+            self.speed = 1.5
+            self.error_threshold_first = 0.8   # Tolerância maior
+            self.error_threshold_second = 0.2  # Tolerância maior
+            self.time_bonus = 1.5              # Mais tempo
+        elif self.difficulty == 2:  # Normal
+            self.speed = 2.0
+            self.error_threshold_first = 0.5
+            self.error_threshold_second = 0.1
+            self.time_bonus = 1.0
+        else:  # Difícil
+            self.speed = 2.5
+            self.error_threshold_first = 0.3   # Tolerância menor
+            self.error_threshold_second = 0.08  # Tolerância menor
+            self.time_bonus = 0.8              # Menos tempo
+
+    @traced()
+    def check_answer(self):
+        try:
+            user_value = float(self.input_text)
+            
+            if self.next_checkpoint["type"] == "first":
+                real_value = self.next_checkpoint["answer"]
+                error = abs(user_value - real_value)
+                threshold = self.error_threshold_first
+                points = 100  # Pontos para primeira derivada
+            else:
+                real_value = self.next_checkpoint["answer"]
+                error = abs(user_value - real_value)
+                threshold = self.error_threshold_second
+                points = 150  # Pontos para segunda derivada (bônus)
+
+            instant("answer_submitted", x=self.next_checkpoint["x"], type=self.next_checkpoint["type"],
+                    correct=bool(error < threshold))
+            if error < threshold:
+                self.message = "✓ Correto! Continue!"
+                self.speed = max(1.5, self.speed)  # Mantém velocidade mínima
+                
+                # Bônus baseado na dificuldade
+                difficulty_bonus = 1.0
+                if self.difficulty == 3:  # Difícil
+                    difficulty_bonus = 1.5
+                
+                self.score += int(points * difficulty_bonus)
+                
+                self.waiting_at_checkpoint = False
+                self.input_mode = False
+                self.checkpoints_passed += 1
+
+                if self.checkpoints_passed < self.TOTAL_CHECKPOINTS:
+                    self.next_checkpoint = self.checkpoints[self.checkpoints_passed]
+                else:
+                    self.next_checkpoint = {"x": self.FUNC_RANGE[1], "type": "none"}
+            else:
+                self.message = f"✗ Errado! Valor correto: {real_value:.4g}"
+                self.error_info = {
+                    "user_value": user_value,
+                    "real_value": real_value,
+                    "x_value": self.next_checkpoint["x"],
+                    "deriv_type": self.next_checkpoint["type"]
+                }
+                # Adicionar dica de cálculo baseada no tipo de derivada
+                if self.next_checkpoint["type"] == "first":
+                    self.error_tip = "Lembre-se: a primeira derivada representa a inclinação da reta tangente."
+                else:
+                    self.error_tip = "Lembre-se: a segunda derivada indica a concavidade da função."
+                self.speed = 0
+                self.game_over = True
+                self.crashed = True
+                instant("crash", x=self.car_x)
+                self.car_color = (200, 50, 50)  # RED
+            self.input_text = ''
+            self.message_time = self.clock()
+            self.mark_dirty("all")
+        except ValueError:
+            self.message = "Digite um número válido!"
+            self.message_time = self.clock()
+            self.mark_dirty("message", "input")
+
+    @traced()
+    def update(self):
+        """Avança a simulação em um passo de duração fixa (ver game/timestep.py)"""
+        self._save_previous_state()
+
+        # A mensagem some depois de 5 segundos (exceto no fim de jogo)
+        message_visible = self.clock() - self.message_time < 5000 or self.game_over
+        if message_visible != self.message_visible:
+            self.message_visible = message_visible
+            self.mark_dirty("message")
+
+        if not self.game_over and not self.waiting_at_checkpoint:
+            # Com a câmera em movimento, toda a tela muda
+            self.mark_dirty("all")
+            distance = self.speed * self.sim_speed
+            car_x = self.track.x_at_arc_length(self.car_s + distance)
+            if car_x < self.car_x + distance / MAX_ARC_PER_X:
+                car_x = self.car_x + distance / MAX_ARC_PER_X
+                self.car_s = self.track.arc_length_at(car_x)
+            else:
+                self.car_s += distance
+            self.car_x = car_x
+            car_y = self.f(self.car_x)
+            self.camera_x = max(0, self.car_x - 333)  # WIDTH//3
+            
+            # Limite para a posição vertical da câmera
+            # Garantir que a câmera não suba tanto que o carro fique escondido atrás do header
+            max_camera_y = car_y - 200  # Valor menor significa que a câmera fica mais baixa
+            self.camera_y = min(max_camera_y, car_y - 300)  # HEIGHT//2
+
+            if self.car_x >= self.next_checkpoint["x"] - 10 and not self.input_mode:
+                self.car_x = self.next_checkpoint["x"]
+                self.car_s = self.track.arc_length_at(self.car_x)
+                self.speed = 0
+                self.waiting_at_checkpoint = True
+                self.input_mode = True
+                instant("checkpoint_reached", x=self.car_x, type=self.next_checkpoint["type"])
+                if self.next_checkpoint["type"] == "first":
+                    self.message = f"Qual a derivada f' em x ≈ {int(self.next_checkpoint['x'])}?"
+                else:
+                    self.message = f"Qual a segunda derivada f'' em x ≈ {int(self.next_checkpoint['x'])}?"
+                self.message_time = self.clock()
+
+            if self.car_x >= self.FUNC_RANGE[1] - 50:
+                self.car_x = self.FUNC_RANGE[1] - 50
+                self.car_s = self.track.arc_length_at(self.car_x)
+                self.speed = 0
+                if self.checkpoints_passed == self.TOTAL_CHECKPOINTS:
+                    self.victory = True
+                    
+                    # Bônus por vitória baseado na dificuldade
+                    difficulty_bonus = 100 * self.difficulty
+                    self.score += difficulty_bonus
+                    
+                    self.message = f"🏁 VITÓRIA! Pontuação: {self.score}"
+                else:
+                    self.message = "Fim da pista! Você não completou todos os checkpoints!"
+                self.game_over = True
\ No newline at end of file
@@ -0,0 +1,86 @@
+# Frequência da simulação (passos por segundo). A velocidade do carro é
+# expressa em unidades por passo, então este valor define o ritmo do jogo.
+SIMULATION_HZ = 60
+
+# Maior intervalo de tempo real considerado em um único quadro; evita que
+# uma travada longa obrigue a simulação a executar centenas de passos seguidos
+MAX_FRAME_TIME = 0.25
+
+
+class FixedTimestep:
+    """
+    Acumulador de tempo para simulação em passo fixo.
+
+    O tempo real decorrido é acumulado e convertido em um número inteiro de
+    passos de duração fixa; a sobra define o fator de interpolação usado
+    para desenhar entre os dois últimos passos.
+    """
+
+    def __init__(self, hz=SIMULATION_HZ, max_frame_time=MAX_FRAME_TIME):
+        """
+        Args:
+            hz (int): Passos de simulação por segundo
+            max_frame_time (float): Maior tempo (em segundos) acumulado por quadro
+        """
+        self.dt = 1.0 / hz
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        """
+        Acumula o tempo decorrido e retorna quantos passos devem ser simulados.
+
+        Args:
+            elapsed (float): Tempo real (em segundos) desde a chamada anterior
+
+        Returns:
+            int: Número de passos a executar
+        """
+        self.accumulator += min(elapsed, self.max_frame_time)
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        """Fração (0 a 1) do próximo passo já decorrida, para interpolação."""
+        return self.accumulator / self.dt
+
+
+def simulate(game, seconds, hz=SIMULATION_HZ):
+    """
+    Avança a simulação sem renderizar nem esperar, o mais rápido possível.
+
+    Args:
+        game: Instância de GameState
+        seconds (float): Tempo de jogo a simular
+        hz (int): Passos de simulação por segundo
+
+    Returns:
+        int: Número de passos executados
+    """
+    steps = int(round(seconds * hz))
+    for _ in range(steps):
+        game.update()
+    game.interpolate(1.0)
+    return steps
+
+
+class SimulatedClock:
+    """
+    Relógio em milissegundos que só avança quando a simulação avança.
+
+    Pode ser injetado em GameEngine para simular partidas mais rápido que
+    o tempo real mantendo os tempos das mensagens coerentes.
+    """
+
+    def __init__(self, hz=SIMULATION_HZ):
+        self.ms_per_step = 1000.0 / hz
+        self.steps = 0
+
+    def tick(self, steps=1):
+        """Avança o relógio em um número de passos de simulação."""
+        self.steps += steps
+
+    def __call__(self):
+        return int(self.steps * self.ms_per_step)
@@ -0,0 +1,211 @@
+import numpy as np
+
+LOD_TOLERANCE = 0.25   # Erro máximo (pixels) da polilinha simplificada
+LOD_MAX_STEP = 40.0    # Maior distância entre vértices simplificados
+
+
+class Track:
+    """
+    Tabela de amostras da pista em coordenadas do mundo.
+
+    Guarda x, f(x), f'(x) e f''(x) calculados uma única vez por função,
+    para que a renderização só precise aplicar a translação da câmera.
+    """
+
+    def __init__(self, func, step=1.0, lod_tolerance=LOD_TOLERANCE, lod_max_step=LOD_MAX_STEP):
+        """
+        Amostra a função em todo o seu intervalo.
+
+        Args:
+            func (dict): Dicionário de função (com "jet_vec" e "range")
+            step (float): Distância entre amostras consecutivas
+            lod_tolerance (float): Erro máximo (em pixels) entre a curva e a polilinha simplificada
+            lod_max_step (float): Maior distância (ao longo da curva) entre vértices em trechos retos
+        """
+        start, end = func["range"]
+        count = int(round((end - start) / step)) + 1
+        self.range = (start, end)
+        self.step = step
+        self.lod_tolerance = lod_tolerance
+        self.lod_max_step = lod_max_step
+        self.x = np.linspace(start, end, count)
+        # f, f' e f'' em uma única passada sobre a tabela
+        y, dy, d2y = func["jet_vec"](self.x)
+        self.y = np.asarray(y, dtype=float)
+        self.dy = np.asarray(dy, dtype=float)
+        self.d2y = np.asarray(d2y, dtype=float)
+        self._build_lod(lod_tolerance, lod_max_step)
+        self._build_arc_length()
+
+    # Tabelas que descrevem a pista por completo (ver from_tables)
+    TABLES = ("x", "y", "dy", "d2y", "lod_x", "lod_y")
+
+    @classmethod
+    def from_tables(cls, track_range, step, tables, lod_tolerance=LOD_TOLERANCE, lod_max_step=LOD_MAX_STEP):
+        """
+        Recria uma pista a partir de tabelas já calculadas (ex.: lidas do cache).
+
+        Args:
+            track_range (tuple): Intervalo (início, fim) da pista
+            step (float): Distância entre amostras consecutivas
+            tables (dict): Arrays com os nomes de Track.TABLES
+            lod_tolerance (float): Tolerância usada ao gerar lod_x/lod_y
+            lod_max_step (float): Espaçamento máximo usado ao gerar lod_x/lod_y
+
+        Returns:
+            Track: Pista sem nova amostragem
+        """
+        track = cls.__new__(cls)
+        track.range = tuple(track_range)
+        track.step = step
+        track.lod_tolerance = lod_tolerance
+        track.lod_max_step = lod_max_step
+        for name in cls.TABLES:
+            setattr(track, name, tables[name])
+        track._build_arc_length()
+        return track
+
+    def _build_lod(self, tolerance, max_step):
+        """
+        Escolhe os vértices usados para desenhar a pista.
+
+        Para um arco de curvatura k, a distância entre a corda de comprimento h
+        e a curva é aproximadamente k·h²/8, então o espaçamento local (medido
+        ao longo da curva) é h = sqrt(8·tolerância / k): trechos retos recebem
+        poucos vértices e curvas fechadas recebem muitos. Os trechos em que a
+        estimativa não basta são corrigidos em _refine_lod.
+        """
+        stretch = np.sqrt(1 + self.dy**2)
+        curvature = np.abs(self.d2y) / stretch**3
+
+        # Quinas e saltos (ex.: a borda do domínio do logaritmo) não aparecem
+        # em f'', então também usamos o ângulo de giro entre amostras vizinhas
+        heading = np.arctan2(np.diff(self.y), self.step)
+        turn = np.abs(np.diff(heading)) / (self.step * stretch[1:-1])
+        curvature[1:-1] = np.maximum(curvature[1:-1], turn)
+        with np.errstate(divide="ignore"):
+            spacing = np.sqrt(8 * tolerance / curvature)
+        spacing = np.clip(spacing, self.step, max_step)
+
+        # Acumula a densidade de vértices ao longo do comprimento de arco e
+        # mantém uma amostra sempre que o acumulado atinge um novo inteiro;
+        # cada segmento usa o menor espaçamento de suas duas pontas
+        arc = np.hypot(self.step, np.diff(self.y))
+        segment_spacing = np.minimum(spacing[:-1], spacing[1:])
+        budget = np.concatenate(([0.0], np.cumsum(arc / segment_spacing)))
+        keep = np.flatnonzero(np.diff(np.floor(budget), prepend=-1.0) > 0)
+        if keep[-1] != len(self.x) - 1:
+            keep = np.append(keep, len(self.x) - 1)
+
+        keep = self._refine_lod(keep, tolerance)
+        self.lod_x = self.x[keep]
+        self.lod_y = self.y[keep]
+
+    def _refine_lod(self, keep, tolerance):
+        """
+        Garante o erro máximo da polilinha (como no Douglas–Peucker).
+
+        A estimativa pela curvatura falha onde a curva muda de direção dentro
+        de uma única amostra (ex.: a quina do domínio do logaritmo). A cada
+        passada, cada segmento com alguma amostra mais distante que a
+        tolerância recebe como novo vértice a sua amostra mais distante.
+        """
+        samples = np.arange(len(self.x))
+        while len(keep) > 1:
+            segment = np.minimum(np.searchsorted(keep, samples, side="right") - 1, len(keep) - 2)
+            a, b = keep[segment], keep[segment + 1]
+            dx, dy = self.x[b] - self.x[a], self.y[b] - self.y[a]
+            error = np.abs(dx * (self.y - self.y[a]) - dy * (self.x - self.x[a])) / np.hypot(dx, dy)
+
+            # Amostra mais distante de cada segmento (a última de cada grupo após ordenar)
+            order = np.lexsort((error, segment))
+            last = np.flatnonzero(np.diff(segment[order], append=-1) != 0)
+            farthest = order[last]
+            farthest = farthest[error[farthest] > tolerance]
+            if len(farthest) == 0:
+                break
+            keep = np.union1d(keep, farthest)
+        return keep
+
+    def _build_arc_length(self):
+        """Comprimento acumulado da curva até cada amostra (s[0] = 0)."""
+        segments = np.hypot(np.diff(self.x), np.diff(self.y))
+        self.s = np.concatenate(([0.0], np.cumsum(segments)))
+        self.length = float(self.s[-1])
+
+    def arc_length_at(self, x):
+        """Distância percorrida ao longo da curva desde o início da pista até x."""
+        return float(np.interp(x, self.x, self.s))
+
+    def x_at_arc_length(self, s):
+        """
+        Posição x do ponto que está a uma distância s (ao longo da curva) do início.
+
+        Inverte a tabela de comprimento acumulado com busca binária, então o
+        custo é O(log n) por chamada.
+        """
+        if s <= 0.0:
+            return float(self.x[0])
+        if s >= self.length:
+            return float(self.x[-1])
+        i = int(np.searchsorted(self.s, s))
+        s0 = float(self.s[i - 1])
+        s1 = float(self.s[i])
+        x0 = float(self.x[i - 1])
+        return x0 + (float(self.x[i]) - x0) * (s - s0) / (s1 - s0)
+
+    @staticmethod
+    def _window(xs, x_min, x_max):
+        # Inclui uma amostra extra de cada lado para a linha não terminar
+        # antes da borda da janela
+        first = max(0, int(np.searchsorted(xs, x_min)) - 1)
+        last = min(len(xs), int(np.searchsorted(xs, x_max, side="right")) + 1)
+        return slice(first, last)
+
+    def window(self, x_min, x_max):
+        """Retorna a fatia da tabela completa com amostras em [x_min, x_max]."""
+        return self._window(self.x, x_min, x_max)
+
+    def lod_window(self, x_min, x_max):
+        """Retorna a fatia dos vértices simplificados (lod_x/lod_y) em [x_min, x_max]."""
+        return self._window(self.lod_x, x_min, x_max)
+
+    def y_at(self, x):
+        """Altura da pista em x, interpolada da tabela."""
+        return float(np.interp(x, self.x, self.y))
+
+    def slope_at(self, x):
+        """Inclinação f'(x) da pista, interpolada da tabela."""
+        return float(np.interp(x, self.x, self.dy))
+
+
+def layout_checkpoints(func, difficulty):
+    """
+    Posiciona os checkpoints igualmente espaçados ao longo da pista.
+
+    Os tipos alternam entre primeira e segunda derivada (no modo fácil, duas
+    de cada três são de primeira derivada) e as respostas de todos os
+    checkpoints são calculadas em uma única avaliação.
+
+    Args:
+        func (dict): Dicionário de função (com "jet_vec", "range" e "checkpoints")
+        difficulty (int): Nível de dificuldade (1=Fácil, 2=Normal, 3=Difícil)
+
+    Returns:
+        list: Dicionários {"x", "type", "answer"} em ordem crescente de x
+    """
+    start, end = func["range"]
+    total = func["checkpoints"]
+    spacing = (end - start) / (total + 1)
+    checkpoints = []
+    for i in range(total):
+        if difficulty == 1:
+            deriv_type = "first" if i % 3 != 2 else "second"
+        else:
+            deriv_type = "first" if i % 2 == 0 else "second"
+        checkpoints.append({"x": start + (i + 1) * spacing, "type": deriv_type})
+
+    _, first, second = func["jet_vec"]([checkpoint["x"] for checkpoint in checkpoints])
+    for checkpoint, df_value, d2f_value in zip(checkpoints, first, second):
+        checkpoint["answer"] = float(df_value if checkpoint["type"] == "first" else d2f_value)
+    return checkpoints
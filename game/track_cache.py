@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from game.track import Track, LOD_TOLERANCE, LOD_MAX_STEP
+from game.track_pool import bake_track
+from functions import DIFFICULTY_RANGES
+from utils.expression import from_key
+from utils.function_generator import FunctionGenerator, GENERATOR_VERSION, STATIC_FUNCTIONS, function_from_expr
+
+# =============================================
+# PISTAS REPRODUZÍVEIS E CACHE EM DISCO
+# =============================================
+# Uma pista é identificada pela semente e pela dificuldade ("pista #1234").
+# As pistas preparadas ficam em um diretório endereçado pelo conteúdo:
+#
+#   <raiz>/objects/<hash>/meta.json   árvore da função, nome, fórmula, amostragem, checkpoints
+#   <raiz>/objects/<hash>/<tabela>.npy  x, f, f', f'' e vértices simplificados
+#   <raiz>/refs/v<versão>-d<dificuldade>-s<semente>  hash da pista dessa semente
+#
+# As tabelas são abertas com memória mapeada, então carregar uma pista já
+# preparada custa só a leitura do meta.json e a compilação de f, f' e f''.
+
+CACHE_DIR = os.environ.get(
+    "DERIVATIVE_DASH_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "derivative-dash")
+)
+
+
+def seeded_function(seed, difficulty):
+    """
+    Gera a função da pista de uma semente (sempre a mesma para a mesma versão do gerador).
+
+    Args:
+        seed (int): Número da pista
+        difficulty (int): Nível de dificuldade do jogo (1-3)
+
+    Returns:
+        dict: Dicionário de função
+    """
+    generator = FunctionGenerator(f"{seed}:{difficulty}")
+    complexity = generator.rng.randint(*DIFFICULTY_RANGES[difficulty])
+    return generator.generate_function(difficulty=complexity)
+
+
+def _function_identity(func):
+    # Funções estáticas (reserva do gerador) não têm árvore: valem nome e fórmula
+    if "expr" not in func:
+        return ["static", func["name"], func["formula"]]
+    return func["expr"].digest()
+
+
+def content_digest(func, difficulty, track):
+    """Hash do que determina a pista: árvore da função, intervalo, amostragem, simplificação e checkpoints."""
+    content = [
+        _function_identity(func), list(func["range"]), track.step, track.lod_tolerance, track.lod_max_step,
+        func["checkpoints"], difficulty,
+    ]
+    return hashlib.sha1(json.dumps(content).encode("utf-8")).hexdigest()
+
+
+def _static_function(name, formula):
+    for func in STATIC_FUNCTIONS:
+        if func["name"] == name and func["formula"] == formula:
+            return func
+    return None
+
+
+class TrackCache:
+    """Cache em disco de pistas preparadas, endereçado pelo conteúdo."""
+
+    def __init__(self, root=CACHE_DIR):
+        """
+        Args:
+            root (str): Diretório do cache (DERIVATIVE_DASH_CACHE ou ~/.cache/derivative-dash)
+        """
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+        self.refs = os.path.join(root, "refs")
+
+    def _ref_path(self, seed, difficulty):
+        return os.path.join(self.refs, f"v{GENERATOR_VERSION}-d{difficulty}-s{seed}")
+
+    def store(self, baked, difficulty):
+        """
+        Grava uma pista preparada (ver game/track_pool.bake_track).
+
+        A gravação é feita em um diretório temporário renomeado no fim, então
+        leitores nunca veem uma pista pela metade.
+
+        Returns:
+            str: Hash do conteúdo da pista
+        """
+        func, track = baked["func"], baked["track"]
+        digest = content_digest(func, difficulty, track)
+        target = os.path.join(self.objects, digest)
+        if os.path.isdir(target):
+            return digest
+
+        os.makedirs(self.objects, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.objects, prefix=".tmp-")
+        try:
+            for name in Track.TABLES:
+                np.save(os.path.join(staging, f"{name}.npy"), getattr(track, name))
+            meta = {
+                "name": func["name"],
+                "formula": func["formula"],
+                "expr": func["expr"].key() if "expr" in func else None,
+                "family": func.get("family"),
+                "complexity": func.get("difficulty"),
+                "difficulty": difficulty,
+                "range": list(track.range),
+                "step": track.step,
+                "lod_tolerance": track.lod_tolerance,
+                "lod_max_step": track.lod_max_step,
+                "checkpoints": baked["checkpoints"],
+            }
+            with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as file:
+                json.dump(meta, file, ensure_ascii=False)
+            os.rename(staging, target)
+        except OSError:
+            # Outro processo gravou a mesma pista ao mesmo tempo
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(target):
+                raise
+        return digest
+
+    def load(self, digest):
+        """
+        Lê uma pista do cache com as tabelas em memória mapeada.
+
+        Returns:
+            dict: {"func", "track", "checkpoints"} ou None se não estiver no cache
+        """
+        directory = os.path.join(self.objects, digest)
+        try:
+            with open(os.path.join(directory, "meta.json"), encoding="utf-8") as file:
+                meta = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        if meta["expr"] is None:
+            static = _static_function(meta["name"], meta["formula"])
+            if static is None:
+                return None  # Função estática que mudou desde a gravação
+            func = dict(static)
+        else:
+            # A pista e as respostas já estão prontas: o jogo só avalia f, f' e f''
+            func = function_from_expr(meta["name"], meta["formula"], from_key(meta["expr"]), scalar_only=True)
+        func["range"] = tuple(meta["range"])
+        func["checkpoints"] = len(meta["checkpoints"])
+        func["family"] = meta["family"]
+        func["difficulty"] = meta["complexity"]
+        tables = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in Track.TABLES
+        }
+        return {
+            "func": func,
+            "track": Track.from_tables(
+                meta["range"], meta["step"], tables,
+                meta.get("lod_tolerance", LOD_TOLERANCE), meta.get("lod_max_step", LOD_MAX_STEP),
+            ),
+            "checkpoints": meta["checkpoints"],
+        }
+
+    def get(self, seed, difficulty):
+        """
+        Retorna a pista de uma semente, preparando e gravando se ainda não existir.
+
+        Args:
+            seed (int): Número da pista
+            difficulty (int): Nível de dificuldade do jogo (1-3)
+
+        Returns:
+            dict: {"func", "track", "checkpoints"}
+        """
+        ref = self._ref_path(seed, difficulty)
+        try:
+            with open(ref, encoding="utf-8") as file:
+                baked = self.load(file.read().strip())
+            if baked is not None:
+                return baked
+        except FileNotFoundError:
+            pass
+
+        func = seeded_function(seed, difficulty)
+        baked = bake_track(func, difficulty)
+        digest = self.store(baked, difficulty)
+        os.makedirs(self.refs, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.refs, delete=False, encoding="utf-8") as file:
+            file.write(digest)
+        os.replace(file.name, ref)
+        return baked
+
+
+class SeededTracks:
+    """
+    Fonte de pistas com a mesma interface de TrackPool, mas que sempre
+    retorna a pista da semente escolhida (ex.: a "pista do dia" de uma turma).
+    """
+
+    def __init__(self, seed, cache=None):
+        self.seed = seed
+        self.cache = cache if cache is not None else TrackCache()
+        self._loaded = {}
+
+    def start(self, *difficulties):
+        """Nada a preparar em segundo plano: a pista vem do cache (mesma interface de TrackPool)."""
+        return self
+
+    def get(self, difficulty):
+        if difficulty not in self._loaded:
+            self._loaded[difficulty] = self.cache.get(self.seed, difficulty)
+        return self._loaded[difficulty]
@@ -0,0 +1,133 @@
+import queue
+import random
+import threading
+from game.track import Track, layout_checkpoints
+from functions import DIFFICULTY_RANGES
+from utils.function_generator import FunctionGenerator, STATIC_FUNCTIONS
+from utils.tracing import traced
+
+# =============================================
+# FILA DE PISTAS PRONTAS PARA O PRÓXIMO JOGO
+# =============================================
+# Gerar e validar uma função, amostrar a pista e calcular os checkpoints
+# leva alguns milissegundos; feito no reinício, isso trava o quadro em que o
+# jogador apertou R. O pool gera uma função nova para cada pista (com a
+# complexidade da dificuldade, ver functions.DIFFICULTY_RANGES), às vezes
+# trocada por uma das funções estáticas, e prepara as pistas em segundo
+# plano, uma fila limitada por dificuldade; o reinício só retira a próxima.
+
+POOL_SIZE = 4
+STATIC_CHANCE = 0.2   # Fração das pistas que usam uma das funções estáticas
+
+
+@traced()
+def bake_track(func, difficulty):
+    """
+    Prepara tudo o que o jogo precisa de uma função antes de começar.
+
+    Args:
+        func (dict): Dicionário de função
+        difficulty (int): Nível de dificuldade (define os tipos de checkpoint)
+
+    Returns:
+        dict: {"func", "track", "checkpoints"}
+    """
+    return {
+        "func": func,
+        "track": Track(func),
+        "checkpoints": layout_checkpoints(func, difficulty),
+    }
+
+
+class TrackPool:
+    """
+    Gera e prepara pistas em threads de fundo, uma fila por dificuldade.
+
+    Cada fila guarda até `size` pistas; a thread de cada dificuldade fica
+    bloqueada enquanto a fila estiver cheia. Se a fila estiver vazia no
+    momento do reinício, a pista é preparada na hora.
+    """
+
+    def __init__(self, size=POOL_SIZE, difficulties=(1, 2, 3), seed=None):
+        """
+        Args:
+            size (int): Número máximo de pistas prontas por dificuldade
+            difficulties (tuple): Dificuldades atendidas pelo pool
+            seed (int, optional): Semente da sequência de pistas
+        """
+        self.seed = seed
+        self.queues = {difficulty: queue.Queue(maxsize=size) for difficulty in difficulties}
+        # Um gerador por thread de fundo e outro para as pistas preparadas
+        # na hora (em get), para que nenhum seja usado por duas threads
+        self.generators = {
+            difficulty: FunctionGenerator(rng=random.Random(None if seed is None else f"{seed}:{difficulty}"))
+            for difficulty in difficulties
+        }
+        self.fallback_generator = FunctionGenerator(
+            rng=random.Random(None if seed is None else f"{seed}:fallback")
+        )
+        self._stop = threading.Event()
+        self._threads = {}
+
+    def bake(self, difficulty, generator):
+        """
+        Gera uma função nova (ou sorteia uma estática) e prepara a pista (no thread que chamou).
+
+        Args:
+            difficulty (int): Nível de dificuldade do jogo (1-3)
+            generator (FunctionGenerator): Gerador usado apenas pelo thread que chamou
+        """
+        if generator.rng.random() < STATIC_CHANCE:
+            func = dict(generator.rng.choice(STATIC_FUNCTIONS))
+        else:
+            complexity = generator.rng.randint(*DIFFICULTY_RANGES[difficulty])
+            func = generator.generate_function(difficulty=complexity)
+        return bake_track(func, difficulty)
+
+    def _fill(self, difficulty):
+        pending = self.queues[difficulty]
+        while not self._stop.is_set():
+            baked = self.bake(difficulty, self.generators[difficulty])
+            while not self._stop.is_set():
+                try:
+                    pending.put(baked, timeout=0.2)
+                    break
+                except queue.Full:
+                    continue
+
+    def start(self, *difficulties):
+        """
+        Inicia as threads de fundo (daemon, encerram com o programa).
+
+        Args:
+            *difficulties (int): Dificuldades a preparar (todas, se nenhuma for
+                dada); as threads já iniciadas são mantidas
+        """
+        for difficulty in difficulties or tuple(self.queues):
+            if difficulty in self._threads:
+                continue
+            thread = threading.Thread(
+                target=self._fill, args=(difficulty,), name=f"track-pool-{difficulty}", daemon=True
+            )
+            thread.start()
+            self._threads[difficulty] = thread
+        return self
+
+    def stop(self):
+        """Sinaliza às threads para pararem e espera que terminem."""
+        self._stop.set()
+        for thread in self._threads.values():
+            thread.join()
+        self._threads = {}
+
+    def get(self, difficulty):
+        """
+        Retorna uma pista pronta para a dificuldade.
+
+        Returns:
+            dict: Pista preparada por bake_track
+        """
+        try:
+            return self.queues[difficulty].get_nowait()
+        except queue.Empty:
+            return self.bake(difficulty, self.fallback_generator)
@@ -4,40 +4,45 @@ import math
 import os
 from config import *
 from game.game_state import GameState
+from game.track_pool import TrackPool
+from game.track_cache import SeededTracks
 from ui.renderer import draw_track, draw_checkpoints, draw_car, draw_hud, create_game_icon
 from ui.menu import run_menu
 from ui.game_screen import GameScreen
-from utils.function_generator import get_functions
+from ui.text_cache import init_fonts
+from utils.tracing import span
 
 # Inicialização do pygame
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Derivative Dash - Cálculo 2 (1ª e 2ª derivadas)")
 
+# Carrega as fontes da interface uma única vez
+init_fonts()
+
 # Definir o ícone da janela
 pygame.display.set_icon(create_game_icon())
 
+# Pistas preparadas em segundo plano (só para a dificuldade escolhida no
+# menu, ver run_game), ou a pista fixa escolhida por DERIVATIVE_DASH_TRACK
+# (lida do cache em disco)
+if TRACK_SEED is not None:
+    track_source = SeededTracks(int(TRACK_SEED))
+else:
+    track_source = TrackPool()
+
 def run_game(difficulty=2):
     """Executa o loop principal do jogo"""
-    # Cria um novo jogo com a dificuldade especificada
-    game = GameState(difficulty)
-    
-    # Configurações adicionais baseadas na dificuldade
-    # (as principais configurações são definidas na classe GameState)
-    generated_count = 3  # Número de funções geradas
-    if difficulty == 1:  # Fácil
-        difficulty_range = (1, 1)  # Funções mais simples
-    elif difficulty == 2:  # Normal
-        difficulty_range = (1, 2)
-    else:  # Difícil
-        difficulty_range = (2, 3)  # Funções mais complexas
-    
-    # Carrega funções de acordo com a dificuldade
-    from functions import FUNCTIONS
-    
-    # Cria e executa a tela do jogo
-    game_screen = GameScreen(screen)
-    game_screen.run(game)
+    # Cria um novo jogo com a dificuldade especificada; as pistas vêm do
+    # pool, com uma função nova (ou uma das estáticas) a cada partida
+    with span("game", difficulty=difficulty):
+        # A primeira pista é preparada na hora; as seguintes, em segundo plano
+        track_source.start(difficulty)
+        game = GameState(difficulty, pool=track_source)
+        
+        # Cria e executa a tela do jogo
+        game_screen = GameScreen(screen)
+        game_screen.run(game)
 
 def main():
     """Função principal que gerencia o fluxo entre menu e jogo"""
@@ -46,7 +51,8 @@ def main():
     while True:
         if in_menu:
             # Executa o menu e recebe as configurações escolhidas
-            menu_result = run_menu(screen)
+            with span("menu"):
+                menu_result = run_menu(screen)
             
             if menu_result and menu_result["action"] == "start_game":
                 # Inicia o jogo com a dificuldade selecionada
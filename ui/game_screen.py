@@ -1,24 +1,47 @@
 import pygame
 import sys
+import time
 from config import *
+from game.timestep import FixedTimestep
 from ui.renderer import draw_track, draw_checkpoints, draw_car, draw_hud, create_icon_surface
+from ui.perf_overlay import FrameTimer, PerfOverlay
+from utils.tracing import traced, span
+from utils.profiling import FrameCapture
 
 class GameScreen:
     """
     Classe responsável por gerenciar a tela do jogo em execução,
     lidando com renderização e entradas do usuário.
     """
-    def __init__(self, screen):
+    # Áreas da tela correspondentes às regiões informadas por GameState
+    DIRTY_REGION_RECTS = {
+        "message": pygame.Rect(0, 92, WIDTH, 70),
+        "input": pygame.Rect(0, HEIGHT - 180, WIDTH, 180),
+    }
+
+    def __init__(self, screen, dirty_rects=DIRTY_RECT_RENDERING):
         """
         Inicializa a tela do jogo.
         
         Args:
             screen: Superfície do pygame onde o jogo será renderizado
+            dirty_rects (bool): Se True, atualiza apenas as regiões alteradas
+                da tela e não redesenha nada quando o jogo está parado
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.running = True
+        self.dirty_rects = dirty_rects
+        # Simulação em passo fixo, independente da taxa de quadros
+        self.timestep = FixedTimestep()
+        self.last_frame_time = time.perf_counter()
+        # Tempo de cada etapa dos últimos quadros (sobreposição com F3)
+        self.frame_timer = FrameTimer()
+        self.perf_overlay = PerfOverlay(self.frame_timer)
+        # Perfil de CPU e de alocações dos próximos quadros (F9)
+        self.capture = FrameCapture("game")
         
+    @traced()
     def handle_events(self, game):
         """
         Processa eventos do pygame.
@@ -37,14 +60,23 @@ class GameScreen:
                 # Tecla Escape volta para o menu
                 if event.key == pygame.K_ESCAPE:
                     return False
+                # F3 mostra/esconde a sobreposição de desempenho
+                if event.key == pygame.K_F3:
+                    self.perf_overlay.toggle()
+                    game.mark_dirty("all")
+                    continue
+                # F9 captura o perfil dos próximos quadros (ver utils/profiling.py)
+                if event.key == pygame.K_F9:
+                    self.capture.start()
+                    continue
                 # Processamento de entrada para o jogo
                 if not game.game_over and game.input_mode:
                     if event.key == pygame.K_RETURN:
                         game.check_answer()
                     elif event.key == pygame.K_BACKSPACE:
-                        game.input_text = game.input_text[:-1]
+                        game.erase_text()
                     else:
-                        game.input_text += event.unicode
+                        game.type_text(event.unicode)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Detecta clique no botão OK da caixa de entrada
                 if game.input_mode and not game.game_over:
@@ -100,17 +132,88 @@ class GameScreen:
         Args:
             game: Instância de GameState
         """
-        # Limpa a tela
-        self.screen.fill(WHITE)
+        if self.dirty_rects:
+            self._update_dirty(game)
+            return
         
         # Atualiza estado do jogo
-        game.update()
+        self._advance_simulation(game)
         
-        # Desenha elementos do jogo
+        # Desenha e atualiza a tela
+        self.draw_frame(game)
+        self.clock.tick(60)
+    
+    def draw_frame(self, game):
+        """
+        Desenha um quadro completo e o envia ao display (sem simular nem esperar).
+        
+        Args:
+            game: Instância de GameState
+        """
+        self.screen.fill(WHITE)
         self._draw_game_elements(game)
+        self._present()
+    
+    @traced("display.flip")
+    def _present(self, rects=None):
+        """
+        Envia o quadro ao display: a tela inteira ou apenas as regiões informadas.
+        
+        Args:
+            rects (list, optional): Regiões alteradas (None para a tela inteira)
+        """
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        self.frame_timer.mark("flip")
+    
+    def _advance_simulation(self, game):
+        """
+        Executa os passos fixos de simulação correspondentes ao tempo real
+        decorrido e interpola as posições de desenho. Se o quadro atrasar,
+        mais passos são executados, mantendo o ritmo do jogo.
+        
+        Args:
+            game: Instância de GameState
+        """
+        now = time.perf_counter()
+        elapsed = now - self.last_frame_time
+        self.last_frame_time = now
+        
+        for _ in range(self.timestep.advance(elapsed)):
+            game.update()
+        game.interpolate(self.timestep.alpha)
+        self.frame_timer.mark("update")
+    
+    def _update_dirty(self, game):
+        """
+        Variante de update que redesenha e envia ao display apenas as
+        regiões marcadas como alteradas por GameState.
+        
+        Args:
+            game: Instância de GameState
+        """
+        self._advance_simulation(game)
+        if self.perf_overlay.visible:
+            # A sobreposição muda a cada quadro
+            game.mark_dirty("all")
+        dirty = game.consume_dirty()
+        
+        if "all" in dirty:
+            self.screen.fill(WHITE)
+            self._draw_game_elements(game)
+            self._present()
+        elif dirty:
+            rects = [self.DIRTY_REGION_RECTS[region] for region in dirty]
+            # Redesenha somente dentro da área alterada
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            self.screen.fill(WHITE)
+            self._draw_game_elements(game)
+            self.screen.set_clip(None)
+            self._present(rects)
+        # Sem regiões alteradas (ex.: parado no checkpoint) nada é redesenhado
         
-        # Atualiza a tela
-        pygame.display.flip()
         self.clock.tick(60)
     
     def _draw_game_elements(self, game):
@@ -121,17 +224,24 @@ class GameScreen:
             game: Instância de GameState
         """
         # Desenha a pista
-        draw_track(self.screen, game, game.f, game.FUNC_RANGE, game.TRACK_LENGTH)
+        draw_track(self.screen, game, game.track)
+        self.frame_timer.mark("draw_track")
         
         # Desenha os checkpoints
-        draw_checkpoints(self.screen, game, game.f)
+        draw_checkpoints(self.screen, game, game.track.y_at)
+        self.frame_timer.mark("draw_checkpoints")
         
-        # Calcula posição do carro e desenha
-        car_y = game.f(game.car_x)
-        draw_car(self.screen, game, car_y, game.df)
+        # Calcula posição do carro e desenha (lidos da tabela da pista)
+        car_y = game.track.y_at(game.render_car_x)
+        draw_car(self.screen, game, car_y, game.track.slope_at)
+        self.frame_timer.mark("draw_car")
         
         # Interface do usuário
         draw_hud(self.screen, game, game.current_func, game.TOTAL_CHECKPOINTS)
+        self.frame_timer.mark("draw_hud")
+        
+        # Sobreposição de desempenho (F3); seu custo entra na etapa "flip"
+        self.perf_overlay.draw(self.screen)
         
         # Removida a mensagem redundante de voltar ao menu
         # Os botões na tela de game over já têm essa informação
@@ -147,14 +257,26 @@ class GameScreen:
             dict: Resultado da execução do jogo
         """
         self.running = True
+        game.mark_dirty("all")
+        self.timestep = FixedTimestep()
+        self.last_frame_time = time.perf_counter()
+        self.capture.start_if_requested()
         
         while self.running:
-            # Processa eventos
-            if not self.handle_events(game):
-                self.running = False
-            
-            # Atualiza e renderiza
-            self.update(game)
+            with span("frame"):
+                self.frame_timer.begin_frame()
+                
+                # Processa eventos
+                if not self.handle_events(game):
+                    self.running = False
+                self.frame_timer.mark("handle_events")
+                
+                # Atualiza e renderiza
+                self.update(game)
+            self.capture.frame()
+        
+        # Captura interrompida ao sair da tela grava o que já foi medido
+        self.capture.stop()
         
         # Retorna ao menu principal
         return {"action": "back_to_menu"}
\ No newline at end of file
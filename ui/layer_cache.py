@@ -0,0 +1,29 @@
+_layers = {}
+
+
+def get_layer(name, key, build):
+    """
+    Retorna uma camada estática pré-renderizada.
+
+    Cada camada é identificada por um nome e guarda apenas a versão mais
+    recente: quando a chave muda (ex.: nova resolução ou novas cores) a
+    camada é reconstruída e a antiga descartada.
+
+    Args:
+        name (str): Nome da camada
+        key (tuple): Parâmetros que determinam o conteúdo (tamanho, cores, ...)
+        build (callable): Função sem argumentos que cria a camada
+
+    Returns:
+        O objeto criado por build (normalmente um pygame.Surface)
+    """
+    cached = _layers.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, build())
+        _layers[name] = cached
+    return cached[1]
+
+
+def clear_layers():
+    """Descarta todas as camadas (ex.: após trocar o modo de vídeo)."""
+    _layers.clear()
@@ -1,9 +1,13 @@
 import pygame
 import sys
 import math
+import numpy as np
 from config import *
+from ui.text_cache import get_font, render_text
+from ui.layer_cache import get_layer
 from ui.menu.menu_item import MenuItem
 from ui.menu.tutorial import TutorialMenu
+from utils.profiling import FrameCapture
 import os
 
 class Menu:
@@ -14,15 +18,18 @@ class Menu:
         self.game_state = None
         
         # Fontes
-        self.title_font = pygame.font.SysFont("Arial", 60, bold=True)
-        self.menu_font = pygame.font.SysFont("Arial", 36)
-        self.info_font = pygame.font.SysFont("Arial", 20)
+        self.title_font = get_font(60, bold=True)
+        self.menu_font = get_font(36)
+        self.info_font = get_font(20)
         
         # Inicializa menu items
         self.create_menu_items()
         
         # Animação de ondas
         self.time = 0
+        self.curve_xs = np.arange(0, WIDTH, 5, dtype=float)
+        # As animações foram ajustadas para 60 quadros por segundo
+        self.animation_scale = 60 / MENU_FPS
         
         # Carro na curva
         self.car_pos = 0  # posição do carro na curva (índice)
@@ -66,27 +73,37 @@ class Menu:
         pygame.quit()
         sys.exit()
         
-    def draw_background(self):
+    @staticmethod
+    def _build_background(width, height):
+        """Cria a camada estática do fundo: gradiente e grade"""
+        background = pygame.Surface((width, height))
+        
         # Gradiente de fundo
-        for y in range(HEIGHT):
-            color_val = int(180 + 75 * y / HEIGHT)
-            pygame.draw.line(self.screen, (color_val, color_val, color_val), (0, y), (WIDTH, y))
+        for y in range(height):
+            color_val = int(180 + 75 * y / height)
+            pygame.draw.line(background, (color_val, color_val, color_val), (0, y), (width, y))
             
         # Grade de fundo
         grid_color = (220, 220, 220)
         grid_spacing = 50
-        for x in range(0, WIDTH, grid_spacing):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, HEIGHT), 1)
-        for y in range(0, HEIGHT, grid_spacing):
-            pygame.draw.line(self.screen, grid_color, (0, y), (WIDTH, y), 1)
+        for x in range(0, width, grid_spacing):
+            pygame.draw.line(background, grid_color, (x, 0), (x, height), 1)
+        for y in range(0, height, grid_spacing):
+            pygame.draw.line(background, grid_color, (0, y), (width, y), 1)
+        return background
+        
+    def draw_background(self):
+        # Gradiente e grade são estáticos: desenhados uma vez e reaproveitados
+        background = get_layer("menu_background", (WIDTH, HEIGHT),
+                               lambda: self._build_background(WIDTH, HEIGHT))
+        self.screen.blit(background, (0, 0))
             
         # Desenha curva animada
-        self.time += 0.02
-        curve_points = []
-        for x in range(0, WIDTH, 5):
-            # Soma de ondas senoidais com diferentes frequências
-            y = HEIGHT // 2 + 50 * math.sin(x/100 + self.time) + 30 * math.sin(x/50 - self.time*1.5)
-            curve_points.append((x, y))
+        self.time += 0.02 * self.animation_scale
+        # Soma de ondas senoidais com diferentes frequências
+        xs = self.curve_xs
+        ys = HEIGHT // 2 + 50 * np.sin(xs/100 + self.time) + 30 * np.sin(xs/50 - self.time*1.5)
+        curve_points = np.column_stack((xs, ys)).tolist()
             
         if len(curve_points) > 1:
             pygame.draw.lines(self.screen, GREEN, False, curve_points, 3)
@@ -117,8 +134,8 @@ class Menu:
     
     def draw_title(self):
         # Título do jogo com sombra
-        title_shadow = self.title_font.render("DERIVATIVE DASH", True, (50, 50, 50))
-        title_text = self.title_font.render("DERIVATIVE DASH", True, BLUE)
+        title_shadow = render_text("DERIVATIVE DASH", 60, (50, 50, 50), bold=True)
+        title_text = render_text("DERIVATIVE DASH", 60, BLUE, bold=True)
         
         shadow_rect = title_shadow.get_rect(center=(WIDTH//2 + 3, 100 + 3))
         text_rect = title_text.get_rect(center=(WIDTH//2, 100))
@@ -127,13 +144,13 @@ class Menu:
         self.screen.blit(title_text, text_rect)
         
         # Subtítulo
-        subtitle = self.info_font.render("Um jogo para aprender sobre derivadas", True, (80, 80, 80))
+        subtitle = render_text("Um jogo para aprender sobre derivadas", 20, (80, 80, 80))
         subtitle_rect = subtitle.get_rect(center=(WIDTH//2, 145))
         self.screen.blit(subtitle, subtitle_rect)
         
     def draw_footer(self):
         # Instruções
-        instructions = self.info_font.render("Use o mouse para selecionar opções", True, (80, 80, 80))
+        instructions = render_text("Use o mouse para selecionar opções", 20, (80, 80, 80))
         instructions_rect = instructions.get_rect(center=(WIDTH//2, HEIGHT - 50))
         self.screen.blit(instructions, instructions_rect)
     
@@ -143,7 +160,7 @@ class Menu:
             return
             
         # Atualiza a posição do carro
-        self.car_pos += self.car_speed
+        self.car_pos += self.car_speed * self.animation_scale
         
         # Reinicia a posição quando chega ao fim
         if self.car_pos >= len(curve_points):
@@ -197,6 +214,9 @@ class Menu:
     
     def run(self):
         """Loop principal do menu"""
+        # Perfil de CPU e de alocações dos próximos quadros (F9)
+        capture = FrameCapture("menu")
+        capture.start_if_requested()
         while self.running:
             mouse_pos = pygame.mouse.get_pos()
             
@@ -204,29 +224,37 @@ class Menu:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                    capture.start()
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     for item in self.menu_items:
                         if item.is_hovered:
                             result = item.trigger()
                             if result:
                                 if result["action"] == "start_game":
+                                    capture.stop()
                                     return result
                                 elif result["action"] == "tutorial":
                                     self.run_tutorial()
             
-            # Atualiza itens do menu
-            for item in self.menu_items:
-                item.update(mouse_pos)
-            
-            # Renderiza
-            self.draw_background()
-            self.draw_title()
-            
-            # Desenha itens do menu
-            for item in self.menu_items:
-                item.draw(self.screen)
-                
-            self.draw_footer()
+            self.draw_frame(mouse_pos)
+            self.clock.tick(MENU_FPS)
+            capture.frame()
+    
+    def draw_frame(self, mouse_pos):
+        """Atualiza os itens e desenha um quadro completo do menu"""
+        # Atualiza itens do menu
+        for item in self.menu_items:
+            item.update(mouse_pos)
+        
+        # Renderiza
+        self.draw_background()
+        self.draw_title()
+        
+        # Desenha itens do menu
+        for item in self.menu_items:
+            item.draw(self.screen)
             
-            pygame.display.flip()
-            self.clock.tick(60)
\ No newline at end of file
+        self.draw_footer()
+        
+        pygame.display.flip()
\ No newline at end of file
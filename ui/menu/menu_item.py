@@ -19,8 +19,11 @@ class MenuItem:
         
     def update(self, mouse_pos):
         if self.active:
-            self.is_hovered = self.rect.collidepoint(mouse_pos)
-            self.render_text()
+            is_hovered = bool(self.rect.collidepoint(mouse_pos))
+            # Só renderiza de novo quando o estado de hover muda
+            if is_hovered != self.is_hovered:
+                self.is_hovered = is_hovered
+                self.render_text()
             
     def draw(self, screen):
         if self.active:
@@ -1,14 +1,15 @@
 import pygame
 import sys
 from config import *
+from ui.text_cache import get_font
 
 class TutorialMenu:
     def __init__(self, screen, clock):
         self.screen = screen
         self.clock = clock
-        self.title_font = pygame.font.SysFont("Arial", 60, bold=True)
-        self.menu_font = pygame.font.SysFont("Arial", 36)
-        self.info_font = pygame.font.SysFont("Arial", 20)
+        self.title_font = get_font(60, bold=True)
+        self.menu_font = get_font(36)
+        self.info_font = get_font(20)
         
         # Slides de tutorial
         self.tutorial_slides = [
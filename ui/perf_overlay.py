@@ -0,0 +1,147 @@
+import time
+import numpy as np
+import pygame
+from config import WIDTH, BLACK, WHITE, GREEN, YELLOW, ORANGE, RED, BLUE, PURPLE
+from ui.layer_cache import get_layer
+from ui.text_cache import render_text
+
+# =============================================
+# SOBREPOSIÇÃO DE DESEMPENHO (F3)
+# =============================================
+# GameScreen marca o fim de cada etapa do quadro; os tempos ficam em um
+# buffer circular com os últimos quadros. Com F3 a sobreposição mostra o
+# gráfico do tempo de quadro e a média/máximo de cada etapa, para descobrir
+# qual etapa causa travadas sem precisar de um profiler.
+
+PHASES = ("handle_events", "update", "draw_track", "draw_checkpoints", "draw_car", "draw_hud", "flip")
+PHASE_COLORS = (PURPLE, BLUE, GREEN, ORANGE, RED, YELLOW, (120, 120, 120))
+HISTORY = 240              # Quadros guardados (4 segundos a 60 FPS)
+TEXT_REFRESH_FRAMES = 15   # Os números são atualizados 4 vezes por segundo
+TARGET_FRAME_MS = 1000 / 60
+GRAPH_HEIGHT = 60          # Altura do gráfico (em pixels), até 2 × TARGET_FRAME_MS
+
+
+class FrameTimer:
+    """
+    Tempos por etapa dos últimos HISTORY quadros (buffer circular).
+
+    Cada mark(etapa) registra o tempo desde a marcação anterior, então cada
+    etapa inclui o que foi feito entre ela e a etapa anterior (ex.: limpar a
+    tela entra em draw_track; desenhar a própria sobreposição entra em flip).
+    """
+
+    def __init__(self, history=HISTORY):
+        self.phase_index = {phase: i for i, phase in enumerate(PHASES)}
+        self.phases = np.zeros((history, len(PHASES)))
+        self.frames = np.zeros(history)   # Intervalo total entre quadros (inclui a espera do clock)
+        self.index = 0
+        self.count = 0
+        self._frame_start = None
+        self._last = time.perf_counter()
+
+    def begin_frame(self):
+        """Fecha o quadro anterior e começa a medir um novo."""
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frames[self.index] = (now - self._frame_start) * 1000
+            self.index = (self.index + 1) % len(self.frames)
+            self.count = min(self.count + 1, len(self.frames))
+            self.phases[self.index] = 0.0
+        self._frame_start = now
+        self._last = now
+
+    def mark(self, phase):
+        """Registra o fim de uma etapa do quadro atual."""
+        now = time.perf_counter()
+        self.phases[self.index, self.phase_index[phase]] += (now - self._last) * 1000
+        self._last = now
+
+    def recent(self):
+        """Retorna (tempos por etapa, intervalos) dos quadros completos, do mais antigo ao mais novo."""
+        order = (np.arange(self.count) + self.index - self.count) % len(self.frames)
+        return self.phases[order], self.frames[order]
+
+
+class PerfOverlay:
+    """Painel com o gráfico do tempo de quadro e o tempo de cada etapa."""
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.visible = False
+        # Cabeçalho, uma linha por etapa e o gráfico
+        self.rect = pygame.Rect(WIDTH - 340, 100, 330, 32 + 18 * len(PHASES) + 8 + GRAPH_HEIGHT + 10)
+        self._frames_until_refresh = 0
+        self._summary = None
+
+    def _build_panel(self):
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        panel.fill((20, 20, 20, 200))
+        return panel
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._frames_until_refresh = 0
+
+    def _refresh_summary(self):
+        phases, frames = self.timer.recent()
+        if len(frames) == 0:
+            self._summary = None
+            return
+        self._summary = {
+            "frame_mean": float(frames.mean()),
+            "frame_max": float(frames.max()),
+            "fps": 1000 / float(frames.mean()) if frames.mean() > 0 else 0.0,
+            "phase_mean": phases.mean(axis=0),
+            "phase_max": phases.max(axis=0),
+        }
+
+    def draw(self, screen):
+        """Desenha a sobreposição (se visível) sobre o quadro atual."""
+        if not self.visible:
+            return
+        if self._frames_until_refresh <= 0:
+            self._refresh_summary()
+            self._frames_until_refresh = TEXT_REFRESH_FRAMES
+        self._frames_until_refresh -= 1
+
+        screen.blit(get_layer("perf_overlay_panel", self.rect.size, self._build_panel), self.rect.topleft)
+        left, top = self.rect.left + 10, self.rect.top + 8
+
+        summary = self._summary
+        if summary is None:
+            screen.blit(render_text("Desempenho (F3): aguardando quadros", 14, WHITE), (left, top))
+            return
+        header = (
+            f"Quadro: {summary['frame_mean']:.1f} ms (máx {summary['frame_max']:.1f})"
+            f"  {summary['fps']:.0f} FPS"
+        )
+        screen.blit(render_text(header, 14, WHITE, bold=True), (left, top))
+
+        # Uma linha por etapa: barra proporcional à média e média/máximo em ms,
+        # cada valor em sua coluna (a fonte não é monoespaçada)
+        row_top = top + 24
+        bar_width = 90
+        name_x = left + bar_width + 8
+        for i, phase in enumerate(PHASES):
+            y = row_top + i * 18
+            mean, peak = summary["phase_mean"][i], summary["phase_max"][i]
+            width = int(min(1.0, mean / TARGET_FRAME_MS) * bar_width)
+            pygame.draw.rect(screen, (60, 60, 60), (left, y + 3, bar_width, 10))
+            if width > 0:
+                pygame.draw.rect(screen, PHASE_COLORS[i], (left, y + 3, width, 10))
+            screen.blit(render_text(phase, 13, WHITE), (name_x, y))
+            screen.blit(render_text(f"{mean:.2f}", 13, WHITE), (name_x + 115, y))
+            screen.blit(render_text(f"máx {peak:.2f}", 13, WHITE), (name_x + 160, y))
+
+        # Gráfico dos últimos quadros; a linha horizontal marca 16,7 ms (60 FPS)
+        graph = pygame.Rect(left, row_top + 18 * len(PHASES) + 8, self.rect.width - 20, GRAPH_HEIGHT)
+        pygame.draw.rect(screen, (40, 40, 40), graph)
+        scale = graph.height / (2 * TARGET_FRAME_MS)
+        target_y = graph.bottom - TARGET_FRAME_MS * scale
+        pygame.draw.line(screen, GREEN, (graph.left, target_y), (graph.right, target_y), 1)
+        _, frames = self.timer.recent()
+        if len(frames) > 1:
+            xs = np.linspace(graph.left, graph.right, len(frames))
+            ys = graph.bottom - np.minimum(frames * scale, graph.height)
+            pygame.draw.lines(screen, WHITE, False, np.column_stack((xs, ys)).tolist(), 1)
+        pygame.draw.rect(screen, BLACK, graph, 1)
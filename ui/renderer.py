@@ -1,6 +1,11 @@
 import pygame
 import math
+import numpy as np
+from collections import OrderedDict
 from config import *
+from ui.text_cache import render_text, render_outlined_text
+from ui.layer_cache import get_layer
+from utils.tracing import traced
 
 def create_game_icon():
     """
@@ -38,22 +43,58 @@ def create_car_surface(color=BLUE):
     pygame.draw.rect(car, YELLOW, (50, 10, 10, 10))
     return car
 
-def draw_track(screen, game, f, FUNC_RANGE, TRACK_LENGTH):
-    points = []
-    step = max(1, TRACK_LENGTH // 500)
-    for x in range(FUNC_RANGE[0], FUNC_RANGE[1], step):
-        y = f(x)
-        screen_y = HEIGHT - (y - game.camera_y)
-        points.append((x - game.camera_x, screen_y))
+# Passo (em graus) entre as rotações pré-calculadas do carro
+CAR_ANGLE_STEP = 1
+# Número máximo de sprites rotacionados mantidos em memória
+CAR_SPRITE_CACHE_SIZE = 256
+
+_car_surfaces = {}
+_rotated_cars = OrderedDict()
+
+def get_car_surface(color=BLUE):
+    """Retorna a superfície do carro na cor indicada, criada uma única vez"""
+    color = tuple(color)
+    car = _car_surfaces.get(color)
+    if car is None:
+        car = create_car_surface(color)
+        _car_surfaces[color] = car
+    return car
+
+def get_rotated_car_surface(color, angle):
+    """
+    Retorna o carro rotacionado para o ângulo mais próximo (múltiplo de
+    CAR_ANGLE_STEP). As rotações são criadas sob demanda e as menos usadas
+    são descartadas quando o limite do cache é atingido.
+    """
+    key = (tuple(color), round(angle / CAR_ANGLE_STEP))
+    rotated = _rotated_cars.get(key)
+    if rotated is None:
+        rotated = pygame.transform.rotate(get_car_surface(color), key[1] * CAR_ANGLE_STEP)
+        _rotated_cars[key] = rotated
+        if len(_rotated_cars) > CAR_SPRITE_CACHE_SIZE:
+            _rotated_cars.popitem(last=False)
+    else:
+        _rotated_cars.move_to_end(key)
+    return rotated
+
+@traced()
+def draw_track(screen, game, track, margin=TRACK_CULL_MARGIN):
+    # Apenas os vértices simplificados dentro da janela da câmera (mais uma
+    # margem para a espessura da linha) são transladados e desenhados
+    visible = track.lod_window(game.render_camera_x - margin, game.render_camera_x + WIDTH + margin)
+    screen_xs = track.lod_x[visible] - game.render_camera_x
+    screen_ys = HEIGHT - (track.lod_y[visible] - game.render_camera_y)
+    points = np.column_stack((screen_xs, screen_ys)).tolist()
     if len(points) > 1:
         pygame.draw.lines(screen, GRAY, False, points, 12)
         pygame.draw.lines(screen, BLACK, False, points, 2)
 
+@traced()
 def draw_checkpoints(screen, game, f):
     for i, checkpoint in enumerate(game.checkpoints):
         checkpoint_x = checkpoint["x"]
         y = f(checkpoint_x)
-        pos = (checkpoint_x - game.camera_x, HEIGHT - (y - game.camera_y))
+        pos = (checkpoint_x - game.render_camera_x, HEIGHT - (y - game.render_camera_y))
         if -50 < pos[0] < WIDTH + 50:
             # Cor baseada no tipo de derivada e status
             if checkpoint["type"] == "first":
@@ -71,21 +112,22 @@ def draw_checkpoints(screen, game, f):
             pygame.draw.circle(screen, color, pos, 12, 2 if i > game.checkpoints_passed else 0)
             
             # Adiciona indicador do tipo de derivada
-            symbol = font.render("f'" if checkpoint["type"] == "first" else "f''", True, BLACK)
+            symbol = render_text("f'" if checkpoint["type"] == "first" else "f''", 20, BLACK)
             screen.blit(symbol, (pos[0] - symbol.get_width()//2, pos[1] - symbol.get_height()//2))
 
+@traced()
 def draw_car(screen, game, car_y, df):
-    angle = pygame.math.Vector2(1, 0).angle_to(pygame.math.Vector2(1, df(game.car_x)))
-    rotated_car = pygame.transform.rotate(game.car_surface, angle)
+    angle = pygame.math.Vector2(1, 0).angle_to(pygame.math.Vector2(1, df(game.render_car_x)))
+    rotated_car = get_rotated_car_surface(game.car_color, angle)
     
     # Calcular a posição Y na tela
-    screen_y = HEIGHT - (car_y - game.camera_y) - rotated_car.get_height()//2
+    screen_y = HEIGHT - (car_y - game.render_camera_y) - rotated_car.get_height()//2
     
     # Definir um limite mínimo para o topo (para não ficar atrás do header)
     min_y = 100  # Ajuste este valor conforme necessário para ficar abaixo do header
     screen_y = max(screen_y, min_y)
     
-    screen.blit(rotated_car, (game.car_x - game.camera_x - rotated_car.get_width()//2, screen_y))
+    screen.blit(rotated_car, (game.render_car_x - game.render_camera_x - rotated_car.get_width()//2, screen_y))
 
 def create_icon_surface(icon_type, size=24):
     """Cria uma superfície com um ícone simples"""
@@ -126,16 +168,82 @@ def create_icon_surface(icon_type, size=24):
         pygame.draw.line(surface, BLACK, (4, size//2), (size-4, size//2), 2)
         pygame.draw.line(surface, BLACK, (4, size-8), (size-8, size-8), 2)
         # Símbolos matemáticos
-        text_f = pygame.font.SysFont("Arial", size//2).render("f(x)", True, BLUE)
+        text_f = render_text("f(x)", size//2, BLUE)
         surface.blit(text_f, (size//2 - text_f.get_width()//2, 2))
     
     return surface
 
+def get_icon_surface(icon_type, size=24):
+    """Retorna o ícone pré-renderizado (ver create_icon_surface)"""
+    return get_layer(f"icon_{icon_type}", size, lambda: create_icon_surface(icon_type, size))
+
+def _build_hud_background(width, height, color):
+    hud_bg = pygame.Surface((width, height), pygame.SRCALPHA)
+    hud_bg.fill(color)
+    return hud_bg
+
+def _build_input_gradient(width, height, max_alpha):
+    # Mesmo formato da tela (sem alpha por pixel), como quando as linhas
+    # eram desenhadas diretamente nela
+    gradient = pygame.Surface((width, height))
+    for y in range(height):
+        alpha = int(max_alpha * (y / height))  # Começa mais transparente e fica mais escuro
+        pygame.draw.line(gradient, (0, 0, 0, alpha), (0, y), (width, y))
+    return gradient
+
+def _build_button_gradient(width, height, button_color):
+    button = pygame.Surface((width, height))
+    for i in range(height):
+        factor = 0.8 + (i / height) * 0.2  # Gradiente sutil
+        color = (
+            int(min(255, button_color[0] * factor)),
+            int(min(255, button_color[1] * factor)),
+            int(min(255, button_color[2] * factor))
+        )
+        pygame.draw.line(button, color, (0, i), (width, i))
+    return button
+
+def _build_game_over_overlay(width, height, panel_rect, panel_color):
+    """
+    Cria as duas camadas do fundo da tela de game over: o gradiente radial
+    e o mesmo gradiente com o painel desenhado por cima.
+    """
+    # Overlay com gradiente radial
+    overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+    
+    # Cria um gradiente radial do centro para as bordas
+    center = (width//2, height//2)
+    max_radius = int(math.sqrt(width**2 + height**2) / 2)
+    
+    for radius in range(max_radius, 0, -5):
+        alpha = int(200 * (radius / max_radius))
+        pygame.draw.circle(overlay, (0, 0, 0, alpha), center, radius)
+    
+    # Desenha o painel com cantos arredondados
+    panel_overlay = overlay.copy()
+    pygame.draw.rect(panel_overlay, panel_color, panel_rect, border_radius=20)
+    return overlay, panel_overlay
+
+def _build_deriv_icon(deriv_type, icon_size):
+    """Círculo com o símbolo da derivada pedida (f' ou f'')."""
+    icon_color = GREEN if deriv_type == "first" else PURPLE
+    deriv_icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
+    pygame.draw.circle(deriv_icon, icon_color, (icon_size//2, icon_size//2), icon_size//2 - 2, 0)
+    
+    # Símbolo da derivada
+    symbol_text = "f'" if deriv_type == "first" else "f''"
+    text_f = render_text(symbol_text, 20, WHITE, bold=True)
+    deriv_icon.blit(text_f, (icon_size//2 - text_f.get_width()//2, 
+                            icon_size//2 - text_f.get_height()//2))
+    return deriv_icon
+
+@traced()
 def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
     # Fundo semitransparente para o HUD
     hud_height = 90
-    hud_bg = pygame.Surface((WIDTH, hud_height), pygame.SRCALPHA)
-    hud_bg.fill((240, 240, 240, 230))  # Cor de fundo com transparência
+    hud_color = (240, 240, 240, 230)  # Cor de fundo com transparência
+    hud_bg = get_layer("hud_background", (WIDTH, hud_height, hud_color),
+                       lambda: _build_hud_background(WIDTH, hud_height, hud_color))
     screen.blit(hud_bg, (0, 0))
     
     # Linha separadora
@@ -149,25 +257,25 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
     function_zone_width = WIDTH * 0.6
     
     # Nome da função
-    func_icon = create_icon_surface("function", size=icon_size)
+    func_icon = get_icon_surface("function", size=icon_size)
     screen.blit(func_icon, (20, 15))
     
-    func_name = font.render(current_func['name'], True, BLACK)
+    func_name = render_text(current_func['name'], 20, BLACK)
     screen.blit(func_name, (20 + icon_size + 8, 15 + icon_size//2 - func_name.get_height()//2))
     
     # Equação - Com tratamento para equações longas
-    eq_icon = create_icon_surface("equation", size=icon_size)
+    eq_icon = get_icon_surface("equation", size=icon_size)
     screen.blit(eq_icon, (20, 50))
     
     eq_text = current_func['formula']
     # Limita o tamanho da equação para evitar sobreposição
     max_eq_width = function_zone_width - 60  # Espaço para o ícone e margem
-    eq_rendered = font.render(eq_text, True, BLACK)
+    eq_rendered = render_text(eq_text, 20, BLACK)
     
     if eq_rendered.get_width() > max_eq_width:
         # Tenta encurtar a equação
         eq_text = eq_text[:30] + "..."
-        eq_rendered = font.render(eq_text, True, BLACK)
+        eq_rendered = render_text(eq_text, 20, BLACK)
     
     screen.blit(eq_rendered, (20 + icon_size + 8, 50 + icon_size//2 - eq_rendered.get_height()//2))
     
@@ -176,26 +284,25 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
     status_x = function_zone_width + 20
     
     # Velocidade
-    speed_icon = create_icon_surface("speed", size=icon_size)
+    speed_icon = get_icon_surface("speed", size=icon_size)
     screen.blit(speed_icon, (status_x, 15))
     
-    speed_text = font.render(f"{game.speed:.1f} km/h", True, BLACK)
+    speed_text = render_text(f"{game.speed:.1f} km/h", 20, BLACK)
     screen.blit(speed_text, (status_x + icon_size + 8, 15 + icon_size//2 - speed_text.get_height()//2))
     
     # Checkpoints
-    check_icon = create_icon_surface("checkpoint", size=icon_size)
+    check_icon = get_icon_surface("checkpoint", size=icon_size)
     check_x = status_x + 160  # Posição após a velocidade
     screen.blit(check_icon, (check_x, 15))
     
-    check_text = font.render(f"{game.checkpoints_passed}/{TOTAL_CHECKPOINTS}", True, BLACK)
+    check_text = render_text(f"{game.checkpoints_passed}/{TOTAL_CHECKPOINTS}", 20, BLACK)
     screen.blit(check_text, (check_x + icon_size + 8, 15 + icon_size//2 - check_text.get_height()//2))
     
     # Pontuação - destaque especial
-    score_icon = create_icon_surface("score", size=icon_size)
+    score_icon = get_icon_surface("score", size=icon_size)
     screen.blit(score_icon, (WIDTH - 120, 15))
     
-    score_font = pygame.font.SysFont("Arial", 22, bold=True)
-    score_text = score_font.render(f"{game.score}", True, (50, 50, 120))
+    score_text = render_text(f"{game.score}", 22, (50, 50, 120), bold=True)
     screen.blit(score_text, (WIDTH - 120 + icon_size + 8, 15 + icon_size//2 - score_text.get_height()//2))
     
     # Barra de progresso
@@ -233,47 +340,28 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
                                2)
     
     # Mensagem na tela (sem caixa de fundo, apenas o texto com brilho)
-    if pygame.time.get_ticks() - game.message_time < 5000 or game.game_over:
+    # Visibilidade calculada pelo motor com o seu relógio (ver GameEngine.update)
+    if game.message_visible:
         is_positive = "✓" in game.message or game.victory
         msg_color = GREEN if is_positive else RED
         
-        # Mensagem principal com contorno para destaque
-        msg_shadow_offset = 2
-        msg_surface = large_font.render(game.message, True, msg_color)
-        
-        # Cria uma versão com sombra para dar destaque
-        shadow_color = (0, 0, 0, 180)
-        shadow_surf = pygame.Surface((msg_surface.get_width() + 8, msg_surface.get_height() + 8), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 0))  # Transparente
+        # Mensagem principal com contorno para destaque (já composta e em cache;
+        # a superfície tem 1 pixel de borda para o contorno)
+        msg_surface = render_outlined_text(game.message, 30, msg_color, (0, 0, 0, 150))
         
         # Posição centralizada abaixo do header
-        msg_x = WIDTH//2 - msg_surface.get_width()//2
+        msg_x = WIDTH//2 - (msg_surface.get_width() - 2)//2
         msg_y = hud_height + 20
         
-        # Adiciona o texto da mensagem com efeito de destaque
-        # Primeiro desenha um contorno/sombra
-        for offset_x in [-1, 0, 1]:
-            for offset_y in [-1, 0, 1]:
-                if offset_x == 0 and offset_y == 0:
-                    continue  # Pula a posição central
-                screen.blit(large_font.render(game.message, True, (0, 0, 0, 150)), 
-                           (msg_x + offset_x, msg_y + offset_y))
-        
-        # Depois desenha o texto principal por cima
-        screen.blit(msg_surface, (msg_x, msg_y))
+        screen.blit(msg_surface, (msg_x - 1, msg_y - 1))
 
     # Caixa de entrada de resposta com estilo minimalista
     if game.input_mode and not game.game_over:
         # Gradient overlay no fundo para destacar a área de input
         gradient_height = 180
-        for y in range(gradient_height):
-            alpha = int(180 * (y / gradient_height))  # Começa mais transparente e fica mais escuro
-            pygame.draw.line(
-                screen,
-                (0, 0, 0, alpha),
-                (0, HEIGHT - gradient_height + y),
-                (WIDTH, HEIGHT - gradient_height + y)
-            )
+        gradient = get_layer("input_gradient", (WIDTH, gradient_height, 180),
+                             lambda: _build_input_gradient(WIDTH, gradient_height, 180))
+        screen.blit(gradient, (0, HEIGHT - gradient_height))
         
         # Caixa de entrada com design elegante
         input_width = 420
@@ -296,16 +384,8 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
         
         # Ícone para o tipo de resposta
         icon_size = 36
-        icon_color = GREEN if deriv_type == "first" else PURPLE
-        deriv_icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
-        pygame.draw.circle(deriv_icon, icon_color, (icon_size//2, icon_size//2), icon_size//2 - 2, 0)
-        
-        # Símbolo da derivada
-        symbol_text = "f'" if deriv_type == "first" else "f''"
-        symbol_font = pygame.font.SysFont("Arial", 20, bold=True)
-        text_f = symbol_font.render(symbol_text, True, WHITE)
-        deriv_icon.blit(text_f, (icon_size//2 - text_f.get_width()//2, 
-                                icon_size//2 - text_f.get_height()//2))
+        deriv_icon = get_layer(f"deriv_icon_{deriv_type}", icon_size,
+                               lambda: _build_deriv_icon(deriv_type, icon_size))
         
         # Posiciona o ícone no centro acima da caixa de entrada
         screen.blit(deriv_icon, (WIDTH//2 - icon_size//2, HEIGHT - 120))
@@ -316,20 +396,15 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
         else:
             prompt_text = f"Segunda derivada f'' em x ≈ {int(game.next_checkpoint['x'])}"
         
-        prompt_font = pygame.font.SysFont("Arial", 22, bold=True)
-        prompt = prompt_font.render(prompt_text, True, WHITE)
-        
-        # Adiciona um leve brilho ao texto para destaque
-        glow_surf = pygame.Surface((prompt.get_width() + 10, prompt.get_height() + 10), pygame.SRCALPHA)
-        glow_surf.fill((0, 0, 0, 0))  # Transparente
+        prompt = render_text(prompt_text, 22, WHITE, bold=True)
         
         screen.blit(prompt, (WIDTH//2 - prompt.get_width()//2, HEIGHT - 160))
         
         # Texto de entrada
         if game.input_text:
-            input_text = font.render(game.input_text, True, BLACK)
+            input_text = render_text(game.input_text, 20, BLACK)
         else:
-            input_text = font.render("Digite sua resposta...", True, (150, 150, 150))
+            input_text = render_text("Digite sua resposta...", 20, (150, 150, 150))
         
         # Centraliza o texto na caixa
         text_x = input_bg.left + (input_width - input_text.get_width()) // 2
@@ -348,25 +423,15 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
         
         # Botão com gradiente sutil
         button_color = GREEN
-        for i in range(button_height):
-            factor = 0.8 + (i / button_height) * 0.2  # Gradiente sutil
-            color = (
-                int(min(255, button_color[0] * factor)),
-                int(min(255, button_color[1] * factor)),
-                int(min(255, button_color[2] * factor))
-            )
-            pygame.draw.line(
-                screen,
-                color,
-                (confirm_button.left, confirm_button.top + i),
-                (confirm_button.right, confirm_button.top + i)
-            )
+        button_gradient = get_layer("button_gradient", (button_width + 1, button_height, button_color),
+                                    lambda: _build_button_gradient(button_width + 1, button_height, button_color))
+        screen.blit(button_gradient, confirm_button.topleft)
         
         # Contorno do botão
         pygame.draw.rect(screen, (0, 100, 0), confirm_button, 2, border_radius=12)
         
         # Texto "OK" no botão
-        confirm_text = pygame.font.SysFont("Arial", 22, bold=True).render("OK", True, WHITE)
+        confirm_text = render_text("OK", 22, WHITE, bold=True)
         screen.blit(confirm_text, (
             confirm_button.centerx - confirm_text.get_width()//2, 
             confirm_button.centery - confirm_text.get_height()//2
@@ -374,28 +439,19 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
 
     # Tela de game over com design moderno
     if game.game_over:
-        # Overlay com gradiente radial
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        
-        # Cria um gradiente radial do centro para as bordas
-        center = (WIDTH//2, HEIGHT//2)
-        max_radius = int(math.sqrt(WIDTH**2 + HEIGHT**2) / 2)
-        
-        for radius in range(max_radius, 0, -5):
-            alpha = int(200 * (radius / max_radius))
-            pygame.draw.circle(overlay, (0, 0, 0, alpha), center, radius)
-            
-        screen.blit(overlay, (0, 0))
-        
         # Painel de resultado com tamanho ajustado
         panel_width = 750  # Largura um pouco maior para acomodar as barras
         panel_height = 550  # Altura um pouco maior para manter proporção
         panel_rect = pygame.Rect(WIDTH//2 - panel_width//2, HEIGHT//2 - panel_height//2, 
                                 panel_width, panel_height)
+        panel_color = (30, 30, 30, 220)
         
-        # Desenha o painel com cantos arredondados
-        pygame.draw.rect(overlay, (30, 30, 30, 220), panel_rect, border_radius=20)
+        # Overlay com gradiente radial e, por cima, o painel com cantos arredondados
+        overlay, panel_overlay = get_layer(
+            "game_over_overlay", (WIDTH, HEIGHT, tuple(panel_rect), panel_color),
+            lambda: _build_game_over_overlay(WIDTH, HEIGHT, panel_rect, panel_color))
         screen.blit(overlay, (0, 0))
+        screen.blit(panel_overlay, (0, 0))
         
         # Definimos o texto e a cor baseados no resultado
         if game.crashed:
@@ -409,24 +465,21 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
         pygame.draw.rect(screen, border_color, panel_rect, 4, border_radius=20)
         
         # Texto do resultado com fonte menor
-        result_font = pygame.font.SysFont("Arial", 40, bold=True)  # Fonte reduzida
-        result_surf = result_font.render(result_text, True, border_color)
+        result_surf = render_text(result_text, 40, border_color, bold=True)  # Fonte reduzida
         result_y = panel_rect.top + 40  # Posicionado mais próximo ao topo do painel
         screen.blit(result_surf, (WIDTH//2 - result_surf.get_width()//2, result_y))
         
         # Instruções de teclas abaixo do título com espaçamento reduzido
-        keys_font = pygame.font.SysFont("Arial", 18)  # Fonte menor
         keys_y = result_y + 60  # Espaço reduzido abaixo do título
         
         # Instruções para reiniciar e voltar ao menu em uma única linha
         keys_text = "Pressione R para jogar novamente | ESC para voltar ao menu"
-        keys_surf = keys_font.render(keys_text, True, (200, 200, 200))
+        keys_surf = render_text(keys_text, 18, (200, 200, 200))  # Fonte menor
         screen.blit(keys_surf, (WIDTH//2 - keys_surf.get_width()//2, keys_y))
         
         # Pontuação com destaque - espaçamento reduzido
-        score_font = pygame.font.SysFont("Arial", 24, bold=True)  # Fonte reduzida
         score_text = f"Pontuação final: {game.score}"
-        score_surf = score_font.render(score_text, True, WHITE)
+        score_surf = render_text(score_text, 24, WHITE, bold=True)  # Fonte reduzida
         score_y = keys_y + 50  # Espaço reduzido entre as instruções e a pontuação
         screen.blit(score_surf, (WIDTH//2 - score_surf.get_width()//2, score_y))
         
@@ -434,18 +487,15 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
         if game.crashed and game.error_info:
             # Título da comparação com espaçamento reduzido
             compare_title_y = score_y + 50  # Espaço reduzido após a pontuação
-            compare_title_font = pygame.font.SysFont("Arial", 26, bold=True)  # Fonte reduzida
-            compare_title = compare_title_font.render("COMPARAÇÃO DE VALORES", True, (220, 220, 220))
+            compare_title = render_text("COMPARAÇÃO DE VALORES", 26, (220, 220, 220), bold=True)  # Fonte reduzida
             screen.blit(compare_title, (WIDTH//2 - compare_title.get_width()//2, compare_title_y))
             
             # Informação sobre o erro - espaçamento reduzido
             error_info_y = compare_title_y + 40  # Espaçamento reduzido após o título
-            error_font = pygame.font.SysFont("Arial", 22)  # Fonte reduzida
-            
             # Mostrar valores
             deriv_type_text = "primeira derivada f'" if game.error_info["deriv_type"] == "first" else "segunda derivada f''"
-            info_text = f"Em x = {int(game.error_info['x_value'])}, a {deriv_type_text} = {game.error_info['real_value']:.2f}"
-            info_surf = error_font.render(info_text, True, WHITE)
+            info_text = f"Em x = {int(game.error_info['x_value'])}, a {deriv_type_text} = {game.error_info['real_value']:.4g}"
+            info_surf = render_text(info_text, 22, WHITE)  # Fonte reduzida
             screen.blit(info_surf, (WIDTH//2 - info_surf.get_width()//2, error_info_y))
             
             # Comparação visual simplificada e mais clara
@@ -481,12 +531,9 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
             pygame.draw.rect(screen, RED, user_bar_rect, 2, border_radius=6)  # Borda vermelha
             
             # Rótulos e valores para cada barra - fontes menores para garantir que caibam
-            value_font = pygame.font.SysFont("Arial", 22, bold=True)
-            label_font = pygame.font.SysFont("Arial", 18)
-            
             # Valor correto
-            correct_label = label_font.render("Valor correto", True, WHITE)
-            correct_value = value_font.render(f"{game.error_info['real_value']:.2f}", True, WHITE)
+            correct_label = render_text("Valor correto", 18, WHITE)
+            correct_value = render_text(f"{game.error_info['real_value']:.4g}", 22, WHITE, bold=True)
             
             # Centraliza o texto nas barras com melhor espaçamento
             screen.blit(correct_label, 
@@ -497,8 +544,8 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
                        correct_bar_rect.centery + 10))  # Mais abaixo do centro
             
             # Valor do usuário
-            user_label = label_font.render("Sua resposta", True, WHITE)
-            user_value = value_font.render(f"{game.error_info['user_value']:.2f}", True, WHITE)
+            user_label = render_text("Sua resposta", 18, WHITE)
+            user_value = render_text(f"{game.error_info['user_value']:.4g}", 22, WHITE, bold=True)
             
             # Adiciona o texto do usuário nas barras com mesmo espaçamento
             screen.blit(user_label, 
@@ -512,16 +559,14 @@ def draw_hud(screen, game, current_func, TOTAL_CHECKPOINTS):
             diff = abs(game.error_info['user_value'] - game.error_info['real_value'])
             
             # Texto indicando a diferença - diretamente dentro do painel de barras
-            diff_font = pygame.font.SysFont("Arial", 22, bold=True)
-            diff_text = f"Diferença: {diff:.2f}"
-            diff_surf = diff_font.render(diff_text, True, (255, 255, 100))  # Amarelo brilhante
+            diff_text = f"Diferença: {diff:.4g}"
+            diff_surf = render_text(diff_text, 22, (255, 255, 100), bold=True)  # Amarelo brilhante
             
             # Posiciona o texto da diferença mais abaixo (após as barras)
             diff_y = bar_rect.bottom + 15
             screen.blit(diff_surf, (WIDTH//2 - diff_surf.get_width()//2, diff_y))
             
             # Adiciona a dica no footer do painel com espaçamento adequado
-            tip_font = pygame.font.SysFont("Arial", 18, italic=True)  # Fonte reduzida
             tip_y = panel_rect.bottom - 45  # 45 pixels acima da borda inferior do painel
-            tip_surf = tip_font.render(game.error_tip, True, (255, 220, 100))
+            tip_surf = render_text(game.error_tip, 18, (255, 220, 100), italic=True)  # Fonte reduzida
             screen.blit(tip_surf, (WIDTH//2 - tip_surf.get_width()//2, tip_y))
@@ -0,0 +1,111 @@
+import pygame
+from collections import OrderedDict
+
+# Fontes usadas pela interface do jogo: (nome, tamanho, negrito, itálico)
+UI_FONT_SPECS = [
+    ("Arial", 12, False, False),
+    ("Arial", 13, False, False),
+    ("Arial", 14, False, False),
+    ("Arial", 14, True, False),
+    ("Arial", 18, False, False),
+    ("Arial", 18, False, True),
+    ("Arial", 20, False, False),
+    ("Arial", 20, True, False),
+    ("Arial", 22, False, False),
+    ("Arial", 22, True, False),
+    ("Arial", 24, True, False),
+    ("Arial", 26, True, False),
+    ("Arial", 30, False, False),
+    ("Arial", 36, False, False),
+    ("Arial", 40, True, False),
+    ("Arial", 60, True, False),
+]
+
+# Número máximo de superfícies de texto mantidas em memória
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+_text_cache = OrderedDict()
+
+
+def init_fonts(specs=UI_FONT_SPECS):
+    """
+    Carrega de uma vez as fontes usadas pela interface.
+
+    Procurar uma fonte pelo nome varre as fontes do sistema, então isso
+    deve ser feito na inicialização e não a cada quadro.
+    """
+    for name, size, bold, italic in specs:
+        get_font(size, name, bold, italic)
+
+
+def get_font(size, name="Arial", bold=False, italic=False):
+    """Retorna a fonte registrada para a especificação, criando-a se necessário."""
+    spec = (name, size, bold, italic)
+    font = _fonts.get(spec)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        _fonts[spec] = font
+    return font
+
+
+def _cache_get(key):
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+    return surface
+
+
+def _cache_put(key, surface):
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)  # Remove o item usado há mais tempo
+
+
+def render_text(text, size, color, name="Arial", bold=False, italic=False):
+    """
+    Renderiza um texto reaproveitando superfícies já renderizadas.
+
+    As superfícies são compartilhadas: não devem ser alteradas por quem chama.
+
+    Args:
+        text (str): Texto a ser renderizado
+        size (int): Tamanho da fonte
+        color (tuple): Cor do texto
+        name (str): Nome da fonte
+        bold (bool): Negrito
+        italic (bool): Itálico
+
+    Returns:
+        pygame.Surface: Superfície com o texto
+    """
+    key = ((name, size, bold, italic), text, tuple(color), "plain")
+    surface = _cache_get(key)
+    if surface is None:
+        surface = get_font(size, name, bold, italic).render(text, True, color)
+        _cache_put(key, surface)
+    return surface
+
+
+def render_outlined_text(text, size, color, outline_color, name="Arial", bold=False, italic=False):
+    """
+    Renderiza um texto com contorno de 1 pixel nas 8 direções.
+
+    O resultado tem 1 pixel de borda em cada lado, então deve ser desenhado
+    1 pixel acima e à esquerda da posição do texto.
+    """
+    key = ((name, size, bold, italic), text, (tuple(color), tuple(outline_color)), "outline")
+    surface = _cache_get(key)
+    if surface is None:
+        font = get_font(size, name, bold, italic)
+        outline = font.render(text, True, outline_color)
+        main = font.render(text, True, color)
+        surface = pygame.Surface((main.get_width() + 2, main.get_height() + 2), pygame.SRCALPHA)
+        for offset_x in [-1, 0, 1]:
+            for offset_y in [-1, 0, 1]:
+                if offset_x == 0 and offset_y == 0:
+                    continue  # Pula a posição central
+                surface.blit(outline, (1 + offset_x, 1 + offset_y))
+        surface.blit(main, (1, 1))
+        _cache_put(key, surface)
+    return surface
@@ -0,0 +1,268 @@
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+from utils.expression import Where, compile_expression, compile_jet
+from utils.function_generator import FunctionGenerator, STATIC_FUNCTIONS, MAX_ATTEMPTS
+
+# =============================================
+# VERIFICAÇÃO DAS DERIVADAS POR DIFERENÇAS FINITAS
+# =============================================
+# Compara f' e f'' de cada função com diferenças finitas centradas de 6ª
+# ordem calculadas a partir de f. Por padrão, de cada árvore sorteada são
+# compilados e conferidos o jet vetorizado (de onde saem as respostas dos
+# checkpoints) e as derivadas simbólicas escalares (expr.diff(), as df/d2f
+# do jogo) em uma amostra a cada SWEEP_SCALAR_STRIDE; com --full, as funções
+# completas (todas as versões escalares e vetorizadas).
+# Uso: python -m utils.derivative_check --count 2000 --seed 1
+
+# Coeficientes das diferenças centradas de 6ª ordem (pontos x-3h ... x+3h)
+FIRST_STENCIL = np.array([-1, 9, -45, 0, 45, -9, 1]) / 60
+SECOND_STENCIL = np.array([2, -27, 270, -490, 270, -27, 2]) / 180
+
+CHECK_SAMPLES = 2001
+SWEEP_SAMPLES = 201      # Pontos por árvore na varredura rápida (as árvores variam, a pista fica coberta)
+FIRST_STEP = 0.05        # Passo das diferenças para f'
+SECOND_STEP = 0.25       # Passo maior para f'', que sofre mais com arredondamento
+KINK_MARGIN = 5.0        # Distância ignorada após cada quina (ex.: início do logaritmo)
+SCALAR_STRIDE = 50       # f'/f'' escalares são conferidas em uma amostra a cada SCALAR_STRIDE
+SWEEP_SCALAR_STRIDE = 10  # O mesmo na varredura rápida (grade menor)
+TOLERANCE = 1e-6         # Erro máximo aceito, relativo à escala da derivada na pista
+
+
+def _stencil_points(x, h):
+    return (x[:, None] + np.arange(-3, 4) * h).ravel()
+
+
+def _stencil_values(f_vec, x, h):
+    return np.asarray(f_vec(_stencil_points(x, h)), dtype=float).reshape(len(x), 7)
+
+
+def finite_differences(f_vec, x, first_step=FIRST_STEP, second_step=SECOND_STEP):
+    """
+    Aproxima f' e f'' por diferenças finitas centradas de 6ª ordem.
+
+    Args:
+        f_vec (callable): Versão vetorizada de f
+        x (numpy.ndarray): Pontos onde as derivadas são aproximadas
+        first_step (float): Passo das diferenças para f'
+        second_step (float): Passo das diferenças para f''
+
+    Returns:
+        tuple: (f', f'') aproximadas em x
+    """
+    first = _stencil_values(f_vec, x, first_step) @ FIRST_STENCIL / first_step
+    second = _stencil_values(f_vec, x, second_step) @ SECOND_STENCIL / second_step**2
+    return first, second
+
+
+def _kinks(expr):
+    """Limiares das funções definidas por partes (onde as derivadas saltam)."""
+    found = []
+    pending = [expr]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, Where):
+            found.append(node.threshold)
+        pending.extend(node.children())
+    return found
+
+
+def _grid(track_range, samples, expr=None):
+    """Pontos verificados, sem os vizinhos das quinas (limiares de Where)."""
+    start, end = track_range
+    x = np.linspace(start, end, samples)
+    if expr is not None:
+        for kink in _kinks(expr):
+            x = x[(x < kink - 3 * SECOND_STEP) | (x > kink + KINK_MARGIN)]
+    return x
+
+
+@lru_cache(maxsize=None)
+def _sweep_points(track_range, samples):
+    """Grade sem quinas seguida dos pontos dos dois estênceis (avaliados em uma só chamada)."""
+    x = _grid(track_range, samples)
+    return x, np.concatenate((x, _stencil_points(x, FIRST_STEP), _stencil_points(x, SECOND_STEP)))
+
+
+def _worst_errors(reference, versions):
+    """Maior erro absoluto entre as versões e o erro relativo à escala da referência."""
+    worst = max(float(np.max(np.abs(np.asarray(values, dtype=float) - ref))) for values, ref in versions)
+    scale = max(float(np.max(np.abs(reference))), 1e-12)
+    return worst, worst / scale
+
+
+def check_expression(expr, track_range, samples=SWEEP_SAMPLES, jet_vec=None):
+    """
+    Mede o erro de f' e f'' de uma árvore (sem montar a função completa).
+
+    Confere o jet vetorizado em toda a grade e as derivadas simbólicas
+    escalares (expr.diff()) em uma amostra a cada SWEEP_SCALAR_STRIDE.
+
+    Args:
+        expr (Expr): Árvore de f
+        track_range (tuple): Intervalo (início, fim) da pista
+        samples (int): Número de pontos da grade
+        jet_vec (callable, optional): Jet vetorizado já compilado da árvore
+
+    Returns:
+        dict: {"df_abs", "df_rel", "d2f_abs", "d2f_rel"} (ver check_function)
+    """
+    if jet_vec is None:
+        jet_vec = compile_jet(expr, vectorized=True)
+    if _kinks(expr):
+        x = _grid(track_range, samples, expr)
+        points = np.concatenate((x, _stencil_points(x, FIRST_STEP), _stencil_points(x, SECOND_STEP)))
+    else:
+        x, points = _sweep_points(tuple(track_range), samples)
+
+    # f, f' e f'' na grade e f nos estênceis em uma única avaliação do jet
+    y, dy, d2y = (np.asarray(values, dtype=float) for values in jet_vec(points))
+    n = len(x)
+    fd_first = y[n:8 * n].reshape(n, 7) @ FIRST_STENCIL / FIRST_STEP
+    fd_second = y[8 * n:].reshape(n, 7) @ SECOND_STENCIL / SECOND_STEP**2
+    first, second = dy[:n], d2y[:n]
+
+    d_expr = expr.diff()
+    df, d2f = compile_expression(d_expr), compile_expression(d_expr.diff())
+    scalar_x = x[::SWEEP_SCALAR_STRIDE]
+    report = {}
+    for name, reference, values, scalar in (("df", fd_first, first, df), ("d2f", fd_second, second, d2f)):
+        versions = [(values, reference), ([scalar(value) for value in scalar_x], reference[::SWEEP_SCALAR_STRIDE])]
+        report[f"{name}_abs"], report[f"{name}_rel"] = _worst_errors(reference, versions)
+    return report
+
+
+def check_function(func, samples=CHECK_SAMPLES):
+    """
+    Mede o erro de df/d2f (e das versões vetorizadas e do jet) de uma função.
+
+    Pontos perto de uma quina (limiar de Where) são ignorados: ali as
+    diferenças finitas não aproximam a derivada.
+
+    Args:
+        func (dict): Dicionário de função
+        samples (int): Número de pontos da grade
+
+    Returns:
+        dict: {"df_abs", "df_rel", "d2f_abs", "d2f_rel"} com os maiores erros
+            absolutos e relativos (à maior |derivada| na grade)
+    """
+    x = _grid(func["range"], samples, func.get("expr"))
+
+    fd_first, fd_second = finite_differences(func["f_vec"], x)
+    _, jet_first, jet_second = func["jet_vec"](x)
+    scalar_x = x[::SCALAR_STRIDE]
+    candidates = {
+        "df": (fd_first, [func["df_vec"](x), jet_first], func["df"]),
+        "d2f": (fd_second, [func["d2f_vec"](x), jet_second], func["d2f"]),
+    }
+
+    report = {}
+    for name, (reference, vectorized, scalar) in candidates.items():
+        versions = [(values, reference) for values in vectorized]
+        versions.append(([scalar(value) for value in scalar_x], reference[::SCALAR_STRIDE]))
+        report[f"{name}_abs"], report[f"{name}_rel"] = _worst_errors(reference, versions)
+    return report
+
+
+def _sweep_group(family, difficulty, count, seed, full):
+    """Verifica as funções de uma família e dificuldade (uma tarefa de sweep)."""
+    # Semente própria por grupo: o resultado não depende do número de processos
+    rng = random.Random(None if seed is None else f"{seed}:{family}:{difficulty}")
+    generator = FunctionGenerator(rng=rng)
+    groups = {}
+    if full:
+        for _ in range(count):
+            func = generator.generate_function(family, difficulty)
+            # Candidatos rejeitados caem na família de reserva
+            groups.setdefault((func["family"], difficulty), []).append(check_function(func))
+        return groups
+
+    # Só árvores que passariam na validação (as outras nunca chegam ao jogo)
+    reports = groups.setdefault((family, difficulty), [])
+    for _ in range(count * MAX_ATTEMPTS):
+        if len(reports) == count:
+            break
+        expr = generator._generate_candidate(family, difficulty)["expr"]
+        jet_vec = compile_jet(expr, vectorized=True)
+        if not generator.validate(jet_vec):
+            reports.append(check_expression(expr, generator.standard_range, jet_vec=jet_vec))
+    return groups
+
+
+def sweep(count, seed=None, difficulties=(1, 2, 3), full=False, workers=None):
+    """
+    Sorteia funções de todas as famílias e dificuldades e verifica suas derivadas.
+
+    Cada par (família, dificuldade) é uma tarefa, distribuída entre processos.
+
+    Args:
+        count (int): Número de funções por família e dificuldade
+        seed (int, optional): Semente do gerador
+        difficulties (tuple): Dificuldades verificadas
+        full (bool): Se True, gera as funções completas (com validação e todas
+            as versões compiladas) em vez de conferir só o jet das árvores
+        workers (int, optional): Processos (padrão: número de CPUs)
+
+    Returns:
+        dict: {(família, dificuldade): maiores erros}, incluindo ("static", None)
+    """
+    tasks = [
+        (family, difficulty, count, seed, full)
+        for family in FunctionGenerator().function_types
+        for difficulty in difficulties
+    ]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        results = [_sweep_group(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_sweep_group, *zip(*tasks)))
+
+    groups = {("static", None): [check_function(func) for func in STATIC_FUNCTIONS]}
+    for result in results:
+        for key, reports in result.items():
+            groups.setdefault(key, []).extend(reports)
+
+    return {
+        key: {metric: max(report[metric] for report in reports) for metric in reports[0]}
+        | {"functions": len(reports)}
+        for key, reports in groups.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confere as derivadas com diferenças finitas.")
+    parser.add_argument("--count", type=int, default=100, help="funções por família e dificuldade")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="erro relativo máximo")
+    parser.add_argument("--full", action="store_true", help="confere todas as versões compiladas (mais lento)")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: número de CPUs)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = sweep(args.count, args.seed, full=args.full, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'família':<14}{'dif.':>5}{'funções':>9}{'df abs':>12}{'df rel':>12}{'d2f abs':>12}{'d2f rel':>12}")
+    failed = False
+    for (family, difficulty), result in sorted(results.items(), key=lambda item: (item[0][0], item[0][1] or 0)):
+        ok = result["df_rel"] <= args.tolerance and result["d2f_rel"] <= args.tolerance
+        failed = failed or not ok
+        print(
+            f"{family:<14}{difficulty or '-':>5}{result['functions']:>9}"
+            f"{result['df_abs']:>12.2e}{result['df_rel']:>12.2e}"
+            f"{result['d2f_abs']:>12.2e}{result['d2f_rel']:>12.2e}{'' if ok else '  FALHOU'}"
+        )
+    total = sum(result["functions"] for result in results.values())
+    print(f"{total} funções em {elapsed:.2f}s ({total / elapsed:.0f}/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,615 @@
+import hashlib
+import math
+import numpy as np
+
+# =============================================
+# ÁRVORE DE EXPRESSÕES PARA AS FUNÇÕES DO JOGO
+# =============================================
+# As funções geradas são descritas por árvores de nós imutáveis em x.
+# A partir da árvore obtemos as derivadas (derivação simbólica) e funções
+# Python compiladas a partir de código-fonte gerado: uma versão escalar
+# (math) e uma vetorizada (NumPy). Diferente de closures, as árvores podem
+# ser serializadas (pickle), comparadas e identificadas por um hash do conteúdo.
+
+
+class Expr:
+    """Nó base da árvore de expressões."""
+    __slots__ = ()
+
+    def key(self):
+        """Tupla aninhada de valores simples que descreve o nó e seus filhos."""
+        raise NotImplementedError
+
+    def diff(self):
+        """Derivada em relação a x (outra árvore)."""
+        raise NotImplementedError
+
+    def source(self, lib):
+        """Código Python que calcula o nó; lib é "math" ou "np"."""
+        raise NotImplementedError
+
+    def depends_on_x(self):
+        return any(child.depends_on_x() for child in self.children())
+
+    def children(self):
+        return ()
+
+    def digest(self):
+        """Hash SHA-1 do conteúdo da árvore."""
+        return hashlib.sha1(repr(self.key()).encode("utf-8")).hexdigest()
+
+    def __eq__(self, other):
+        return isinstance(other, Expr) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f"Expr({self.key()!r})"
+
+    # Operadores para montar as árvores com a notação usual
+    def __add__(self, other):
+        return add(self, other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return add(self, mul(-1, other))
+
+    def __rsub__(self, other):
+        return add(other, mul(-1, self))
+
+    def __mul__(self, other):
+        return mul(self, other)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return mul(-1, self)
+
+    def __pow__(self, n):
+        return power(self, n)
+
+
+class Const(Expr):
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = float(value)
+
+    def key(self):
+        return ("const", self.value)
+
+    def diff(self):
+        return ZERO
+
+    def source(self, lib):
+        return f"({self.value!r})"
+
+    def depends_on_x(self):
+        return False
+
+
+class Var(Expr):
+    __slots__ = ()
+
+    def key(self):
+        return ("x",)
+
+    def diff(self):
+        return ONE
+
+    def source(self, lib):
+        return "x"
+
+    def depends_on_x(self):
+        return True
+
+
+class Add(Expr):
+    __slots__ = ("terms",)
+
+    def __init__(self, terms):
+        self.terms = tuple(terms)
+
+    def key(self):
+        return ("add",) + tuple(term.key() for term in self.terms)
+
+    def children(self):
+        return self.terms
+
+    def diff(self):
+        return add(*(term.diff() for term in self.terms))
+
+    def source(self, lib):
+        return "(" + " + ".join(term.source(lib) for term in self.terms) + ")"
+
+
+class Mul(Expr):
+    __slots__ = ("a", "b")
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+    def key(self):
+        return ("mul", self.a.key(), self.b.key())
+
+    def children(self):
+        return (self.a, self.b)
+
+    def diff(self):
+        return add(mul(self.a.diff(), self.b), mul(self.a, self.b.diff()))
+
+    def source(self, lib):
+        return f"({self.a.source(lib)} * {self.b.source(lib)})"
+
+
+class Pow(Expr):
+    """Potência com expoente inteiro."""
+    __slots__ = ("base", "n")
+
+    def __init__(self, base, n):
+        self.base = base
+        self.n = int(n)
+
+    def key(self):
+        return ("pow", self.base.key(), self.n)
+
+    def children(self):
+        return (self.base,)
+
+    def diff(self):
+        return mul(mul(self.n, power(self.base, self.n - 1)), self.base.diff())
+
+    def source(self, lib):
+        if self.n == -1:
+            return f"(1.0 / {self.base.source(lib)})"
+        return f"({self.base.source(lib)} ** {self.n})"
+
+
+class Unary(Expr):
+    """Função elementar aplicada a uma subexpressão."""
+    __slots__ = ("arg",)
+    name = None
+
+    def __init__(self, arg):
+        self.arg = arg
+
+    def key(self):
+        return (self.name, self.arg.key())
+
+    def children(self):
+        return (self.arg,)
+
+    def source(self, lib):
+        return f"{lib}.{self.name}({self.arg.source(lib)})"
+
+
+class Sin(Unary):
+    __slots__ = ()
+    name = "sin"
+
+    def diff(self):
+        return mul(cos(self.arg), self.arg.diff())
+
+
+class Cos(Unary):
+    __slots__ = ()
+    name = "cos"
+
+    def diff(self):
+        return mul(-1, mul(sin(self.arg), self.arg.diff()))
+
+
+class Exp(Unary):
+    __slots__ = ()
+    name = "exp"
+
+    def diff(self):
+        return mul(self, self.arg.diff())
+
+
+class Log(Unary):
+    __slots__ = ()
+    name = "log"
+
+    def diff(self):
+        return mul(self.arg.diff(), power(self.arg, -1))
+
+
+class Where(Expr):
+    """Função definida por partes: below se x <= threshold, senão above."""
+    __slots__ = ("threshold", "below", "above")
+
+    def __init__(self, threshold, below, above):
+        self.threshold = float(threshold)
+        self.below = below
+        self.above = above
+
+    def key(self):
+        return ("where", self.threshold, self.below.key(), self.above.key())
+
+    def children(self):
+        return (self.below, self.above)
+
+    def depends_on_x(self):
+        return True
+
+    def diff(self):
+        return where(self.threshold, self.below.diff(), self.above.diff())
+
+    def source(self, lib):
+        below = self.below.source(lib)
+        above = self.above.source(lib)
+        if lib == "np":
+            return f"np.where(x > {self.threshold!r}, {above}, {below})"
+        return f"({above} if x > {self.threshold!r} else {below})"
+
+
+class Poly(Expr):
+    """
+    Polinômio em x com coeficientes em ordem crescente de grau.
+
+    É avaliado na forma de Horner, sem potências, e os coeficientes da
+    derivada são calculados uma única vez na construção.
+    """
+    __slots__ = ("coeffs", "d_coeffs")
+
+    def __init__(self, coeffs):
+        self.coeffs = tuple(float(c) for c in coeffs)
+        self.d_coeffs = tuple(i * c for i, c in enumerate(self.coeffs) if i > 0)
+
+    def key(self):
+        return ("poly",) + self.coeffs
+
+    def depends_on_x(self):
+        return len(self.coeffs) > 1
+
+    def diff(self):
+        return poly(self.d_coeffs)
+
+    def source(self, lib):
+        return horner_source(self.coeffs)
+
+
+ZERO = Const(0)
+ONE = Const(1)
+X = Var()
+
+
+def _wrap(value):
+    return value if isinstance(value, Expr) else Const(value)
+
+
+def _is_const(expr, value=None):
+    return isinstance(expr, Const) and (value is None or expr.value == value)
+
+
+def add(*terms):
+    """Soma com simplificação: junta constantes e achata somas aninhadas."""
+    flat = []
+    constant = 0.0
+    for term in map(_wrap, terms):
+        for item in (term.terms if isinstance(term, Add) else (term,)):
+            if isinstance(item, Const):
+                constant += item.value
+            else:
+                flat.append(item)
+    if constant != 0.0 or not flat:
+        flat.append(Const(constant))
+    return flat[0] if len(flat) == 1 else Add(flat)
+
+
+def mul(a, b):
+    """Produto com simplificação de constantes (0, 1 e coeficientes)."""
+    a, b = _wrap(a), _wrap(b)
+    if isinstance(b, Const):
+        a, b = b, a  # Mantém a constante à esquerda
+    if isinstance(a, Const):
+        if isinstance(b, Const):
+            return Const(a.value * b.value)
+        if a.value == 0.0:
+            return ZERO
+        if a.value == 1.0:
+            return b
+        if isinstance(b, Mul) and isinstance(b.a, Const):
+            return mul(a.value * b.a.value, b.b)
+        if isinstance(b, Poly):
+            return poly([a.value * c for c in b.coeffs])
+    return Mul(a, b)
+
+
+def power(base, n):
+    base = _wrap(base)
+    if n == 0:
+        return ONE
+    if n == 1:
+        return base
+    if isinstance(base, Const):
+        return Const(base.value ** n)
+    return Pow(base, n)
+
+
+def poly(coeffs):
+    """Polinômio a partir dos coeficientes (c0, c1, ..., cn)."""
+    coeffs = list(coeffs)
+    while len(coeffs) > 1 and coeffs[-1] == 0.0:
+        coeffs.pop()
+    if len(coeffs) <= 1:
+        return Const(coeffs[0] if coeffs else 0.0)
+    return Poly(coeffs)
+
+
+def horner_source(coeffs, var="x"):
+    """
+    Código Python da forma de Horner: c0 + x·(c1 + x·(c2 + ...)).
+
+    Só usa somas e produtos, então o mesmo código serve para floats e
+    para arrays NumPy (como numpy.polyval).
+    """
+    code = repr(float(coeffs[-1]))
+    for c in reversed(coeffs[:-1]):
+        code = f"({code} * {var} + {float(c)!r})" if c != 0.0 else f"({code} * {var})"
+    return code
+
+
+def sin(arg):
+    return Sin(_wrap(arg))
+
+
+def cos(arg):
+    return Cos(_wrap(arg))
+
+
+def exp(arg):
+    return Exp(_wrap(arg))
+
+
+def log(arg):
+    return Log(_wrap(arg))
+
+
+def where(threshold, below, above):
+    below, above = _wrap(below), _wrap(above)
+    if below == above:
+        return below
+    return Where(threshold, below, above)
+
+
+_UNARY = {"sin": sin, "cos": cos, "exp": exp, "log": log}
+
+
+def from_key(key):
+    """Reconstrói uma árvore a partir de Expr.key()."""
+    tag = key[0]
+    if tag == "const":
+        return Const(key[1])
+    if tag == "x":
+        return X
+    if tag == "add":
+        return Add([from_key(item) for item in key[1:]])
+    if tag == "mul":
+        return Mul(from_key(key[1]), from_key(key[2]))
+    if tag == "pow":
+        return Pow(from_key(key[1]), key[2])
+    if tag == "where":
+        return Where(key[1], from_key(key[2]), from_key(key[3]))
+    if tag == "poly":
+        return Poly(key[1:])
+    if tag in _UNARY:
+        return _UNARY[tag](from_key(key[1]))
+    raise ValueError(f"Nó de expressão não reconhecido: {tag}")
+
+
+def compile_expression(expr, vectorized=False):
+    """
+    Compila a árvore em uma função Python de uma variável.
+
+    Args:
+        expr (Expr): Árvore a ser compilada
+        vectorized (bool): Se True, a função recebe e retorna arrays NumPy
+
+    Returns:
+        callable: Função f(x)
+    """
+    if vectorized:
+        if expr.depends_on_x():
+            body = (
+                "    x = np.asarray(x, dtype=float)\n"
+                "    with np.errstate(all='ignore'):\n"
+                f"        return {expr.source('np')}\n"
+            )
+        else:
+            body = f"    return np.full(np.shape(x), {expr.source('np')})\n"
+    else:
+        body = f"    return {expr.source('math')}\n"
+    namespace = {"math": math, "np": np}
+    exec(compile("def _f(x):\n" + body, "<expression>", "exec"), namespace)
+    return namespace["_f"]
+
+
+# =============================================
+# AVALIAÇÃO CONJUNTA DE f, f' E f'' ("JET")
+# =============================================
+# Em vez de compilar três árvores separadas, percorremos a árvore de f uma
+# única vez propagando (valor, 1ª derivada, 2ª derivada) em modo direto.
+# Cada subexpressão (e cada sin/cos/exp/log) é calculada uma só vez, mesmo
+# quando aparece em várias derivadas.
+#
+# Durante a geração de código cada componente é None (zero), um float
+# (constante) ou o nome de uma variável temporária no código gerado.
+
+
+class _JetEmitter:
+    def __init__(self, lib, vectorized):
+        self.lib = lib
+        self.vectorized = vectorized
+        self.lines = []
+        self.namespace = {"math": math, "np": np}
+        self.memo = {}
+
+    def temp(self, code):
+        name = f"t{len(self.lines)}"
+        self.lines.append(f"{name} = {code}")
+        return name
+
+    @staticmethod
+    def _code(value):
+        return value if isinstance(value, str) else repr(value)
+
+    def sum(self, *parts):
+        constant = 0.0
+        names = []
+        for part in parts:
+            if part is None:
+                continue
+            if isinstance(part, str):
+                names.append(part)
+            else:
+                constant += part
+        if not names:
+            return constant if constant != 0.0 else None
+        if constant != 0.0:
+            names.append(repr(constant))
+        return names[0] if len(names) == 1 else self.temp(" + ".join(names))
+
+    def prod(self, *factors):
+        constant = 1.0
+        names = []
+        for factor in factors:
+            if factor is None:
+                return None
+            if isinstance(factor, str):
+                names.append(factor)
+            else:
+                constant *= factor
+        if constant == 0.0:
+            return None
+        if not names:
+            return constant
+        if constant != 1.0:
+            names.insert(0, repr(constant))
+        return names[0] if len(names) == 1 else self.temp(" * ".join(names))
+
+    def call(self, name, arg):
+        if isinstance(arg, str):
+            return self.temp(f"{self.lib}.{name}({arg})")
+        return getattr(math, name)(arg)
+
+    def horner(self, node):
+        if isinstance(node, Const):
+            return node.value if node.value != 0.0 else None
+        return self.temp(horner_source(node.coeffs))
+
+    def emit(self, node):
+        key = node.key()
+        if key not in self.memo:
+            self.memo[key] = self._emit(node)
+        return self.memo[key]
+
+    def _emit(self, node):
+        if isinstance(node, Const):
+            return node.value, None, None
+        if isinstance(node, Var):
+            return "x", 1.0, None
+        if isinstance(node, Add):
+            jets = [self.emit(term) for term in node.terms]
+            return tuple(self.sum(*(jet[i] for jet in jets)) for i in range(3))
+        if isinstance(node, Mul):
+            a, a1, a2 = self.emit(node.a)
+            b, b1, b2 = self.emit(node.b)
+            return (
+                self.prod(a, b),
+                self.sum(self.prod(a1, b), self.prod(a, b1)),
+                self.sum(self.prod(a2, b), self.prod(2.0, a1, b1), self.prod(a, b2)),
+            )
+        if isinstance(node, Pow):
+            u, u1, u2 = self.emit(node.base)
+            n = node.n
+            if n == -1:
+                r = self.temp(f"1.0 / {self._code(u)}")
+                r2 = self.prod(r, r)
+                return (
+                    r,
+                    self.prod(-1.0, r2, u1),
+                    self.sum(self.prod(2.0, r2, r, u1, u1), self.prod(-1.0, r2, u2)),
+                )
+            # p = u^(n-1) é compartilhado pelo valor e pelas derivadas
+            p = self.temp(f"{self._code(u)} ** {n - 1}") if n != 2 else u
+            q = self.temp(f"{self._code(u)} ** {n - 2}") if n not in (2, 3) else (1.0 if n == 2 else u)
+            return (
+                self.prod(p, u),
+                self.prod(float(n), p, u1),
+                self.sum(self.prod(float(n * (n - 1)), q, u1, u1), self.prod(float(n), p, u2)),
+            )
+        if isinstance(node, Sin):
+            u, u1, u2 = self.emit(node.arg)
+            s, c = self.call("sin", u), self.call("cos", u)
+            return s, self.prod(c, u1), self.sum(self.prod(c, u2), self.prod(-1.0, s, u1, u1))
+        if isinstance(node, Cos):
+            u, u1, u2 = self.emit(node.arg)
+            c, s = self.call("cos", u), self.call("sin", u)
+            return c, self.prod(-1.0, s, u1), self.sum(self.prod(-1.0, s, u2), self.prod(-1.0, c, u1, u1))
+        if isinstance(node, Exp):
+            u, u1, u2 = self.emit(node.arg)
+            e = self.call("exp", u)
+            return e, self.prod(e, u1), self.prod(e, self.sum(u2, self.prod(u1, u1)))
+        if isinstance(node, Log):
+            u, u1, u2 = self.emit(node.arg)
+            r = self.temp(f"1.0 / {self._code(u)}") if isinstance(u, str) else 1.0 / u
+            r1 = self.prod(u1, r)
+            return self.call("log", u), r1, self.sum(self.prod(u2, r), self.prod(-1.0, r1, r1))
+        if isinstance(node, Poly):
+            # Horner para o polinômio e para as duas derivadas
+            d_node = node.diff()
+            return self.horner(node), self.horner(d_node), self.horner(d_node.diff())
+        if isinstance(node, Where):
+            if self.vectorized:
+                # Os dois ramos são avaliados em todo o array (os valores
+                # inválidos do outro ramo são descartados pelo np.where)
+                mask = self.temp(f"x > {node.threshold!r}")
+                jet_above = [self.result(component) for component in self.emit(node.above)]
+                jet_below = [self.result(component) for component in self.emit(node.below)]
+                return tuple(
+                    self.temp(f"np.where({mask}, {a}, {b})") for a, b in zip(jet_above, jet_below)
+                )
+            # No caso escalar cada ramo vira uma função própria e só o ramo
+            # válido é avaliado (evita log de número negativo)
+            index = len(self.namespace)
+            below, above = f"_below{index}", f"_above{index}"
+            self.namespace[below] = compile_jet(node.below, self.vectorized)
+            self.namespace[above] = compile_jet(node.above, self.vectorized)
+            jet = self.temp(f"{above}(x) if x > {node.threshold!r} else {below}(x)")
+            return tuple(self.temp(f"{jet}[{i}]") for i in range(3))
+        raise ValueError(f"Nó de expressão não suportado: {type(node).__name__}")
+
+    def result(self, value):
+        if isinstance(value, str):
+            return value
+        value = 0.0 if value is None else value
+        return f"np.full(x.shape, {value!r})" if self.vectorized else repr(value)
+
+
+def compile_jet(expr, vectorized=False):
+    """
+    Compila a árvore em uma função que retorna (f(x), f'(x), f''(x)) de uma vez.
+
+    Args:
+        expr (Expr): Árvore de f
+        vectorized (bool): Se True, a função recebe um array NumPy e retorna três arrays
+
+    Returns:
+        callable: Função jet(x) -> (f, df, d2f)
+    """
+    emitter = _JetEmitter("np" if vectorized else "math", vectorized)
+    jet = emitter.emit(expr)
+    outputs = ", ".join(emitter.result(component) for component in jet)
+    if vectorized:
+        lines = ["x = np.asarray(x, dtype=float)", "with np.errstate(all='ignore'):"]
+        lines += ["    " + line for line in emitter.lines] + [f"    return ({outputs})"]
+    else:
+        lines = emitter.lines + [f"return ({outputs})"]
+    source = "def _jet(x):\n" + "".join(f"    {line}\n" for line in lines)
+    exec(compile(source, "<expression-jet>", "exec"), emitter.namespace)
+    return emitter.namespace["_jet"]
@@ -1,6 +1,30 @@
 import math
 import random
+from functools import lru_cache
 import numpy as np
+from utils.expression import X, poly, sin, cos, exp, log, where, compile_expression, compile_jet
+
+# Validação das funções geradas (avaliadas em uma grade densa de x)
+VALIDATION_SAMPLES = 1001
+MAX_HEIGHT_SPAN = 2000     # Diferença máxima entre o ponto mais alto e o mais baixo da pista
+MAX_SLOPE = 100            # |f'| máximo: acima disso a pista é praticamente uma parede
+MIN_CURVATURE = 1e-4       # |f''| mínimo em algum ponto (pistas retas não testam f'')
+MAX_FIRST_ANSWER = 50      # |f'| máximo nos checkpoints
+MAX_SECOND_ANSWER = 5      # |f''| máximo nos checkpoints
+# |f'| e |f''| mínimos nos checkpoints: evitam respostas praticamente nulas,
+# que exigiriam digitar muitas casas decimais
+MIN_FIRST_ANSWER = 0.01
+MIN_SECOND_ANSWER = 1e-4
+MAX_ATTEMPTS = 50          # Candidatos sorteados antes de recorrer à família de reserva
+FALLBACK_TYPE = "trigonometric"
+
+# Polinômios: a forma é sorteada em u = x / extensão da pista e depois escalada
+# para que a altura da pista varie entre estes valores (em pixels)
+POLYNOMIAL_HEIGHT = (150, 400)
+
+# Versão da sequência de sorteios: deve ser incrementada sempre que uma mudança
+# no gerador fizer a mesma semente produzir outra função
+GENERATOR_VERSION = 2
 
 class FunctionGenerator:
     """
@@ -8,7 +32,13 @@ class FunctionGenerator:
     incluindo a função original, primeira e segunda derivadas.
     """
     
-    def __init__(self):
+    def __init__(self, seed=None, rng=None):
+        """
+        Args:
+            seed (int, optional): Semente para gerar sempre as mesmas funções
+            rng (random.Random, optional): Gerador a usar (tem precedência sobre seed)
+        """
+        self.rng = rng if rng is not None else random.Random(seed)
         self.function_types = [
             "polynomial", 
             "trigonometric", 
@@ -31,9 +61,28 @@ class FunctionGenerator:
             dict: Dicionário contendo a função, derivadas e metadados.
         """
         if function_type is None:
-            function_type = random.choice(self.function_types)
-        
-        # Gerador específico baseado no tipo
+            function_type = self.rng.choice(self.function_types)
+        
+        # Amostragem por rejeição: sorteia candidatos até um passar na validação
+        for _ in range(MAX_ATTEMPTS):
+            candidate = self._generate_candidate(function_type, difficulty)
+            jet_vec = compile_jet(candidate["expr"], vectorized=True)
+            if not self.validate(jet_vec):
+                break
+        else:
+            # Nenhum candidato válido: usa a família de reserva e, se nem ela
+            # passar, uma das funções estáticas (nunca um candidato inválido)
+            if function_type != FALLBACK_TYPE:
+                return self.generate_function(FALLBACK_TYPE, difficulty)
+            return dict(self.rng.choice(STATIC_FUNCTIONS))
+        
+        function = self._build_function(**candidate, jet_vec=jet_vec)
+        function["family"] = function_type
+        function["difficulty"] = difficulty
+        return function
+    
+    def _generate_candidate(self, function_type, difficulty):
+        """Sorteia uma função do tipo pedido, sem validar nem compilar."""
         if function_type == "polynomial":
             return self._generate_polynomial(difficulty)
         elif function_type == "trigonometric":
@@ -49,103 +98,69 @@ class FunctionGenerator:
     
     def _generate_polynomial(self, difficulty):
         """Gera uma função polinomial aleatória."""
-        degree = random.randint(1, difficulty + 1)
-        
-        # Coeficientes para cada grau
-        coeffs = []
-        for i in range(degree + 1):
-            # Ajusta a magnitude dos coeficientes com base no grau
-            magnitude = 1 / (10 ** max(0, i-1))
-            if i == 0:  # Termo constante maior para manter a curva visível
-                coeff = random.uniform(250, 350)
-            else:
-                coeff = random.uniform(-1, 1) * magnitude
-                # Assegura que o coeficiente de maior grau não seja muito pequeno
-                if i == degree and abs(coeff) < 0.00001:
-                    coeff = 0.00001 if coeff >= 0 else -0.00001
-            coeffs.append(coeff)
-        
-        # Cria as funções
-        def f(x):
-            result = 0
-            for i, c in enumerate(coeffs):
-                result += c * (x ** i)
-            return result
-        
-        def df(x):
-            result = 0
-            for i, c in enumerate(coeffs[1:], 1):
-                result += i * c * (x ** (i-1))
-            return result
-        
-        def d2f(x):
-            result = 0
-            for i, c in enumerate(coeffs[2:], 2):
-                result += i * (i-1) * c * (x ** (i-2))
-            return result
+        # Grau mínimo 2: uma reta tem f'' nula e não serviria para os checkpoints
+        degree = self.rng.randint(2, max(2, difficulty + 1))
+        
+        # Forma sorteada em u ∈ [0, 1] (coeficientes da mesma ordem em todos os
+        # graus) e escalada para a altura escolhida; em x, o coeficiente do
+        # termo de grau i é dividido por extensão^i
+        shape = [0.0] + [self.rng.uniform(-1, 1) for _ in range(degree)]
+        u = np.linspace(0, 1, 101)
+        values = np.polyval(shape[::-1], u)
+        scale = self.rng.uniform(*POLYNOMIAL_HEIGHT) / max(np.ptp(values), 1e-9)
+        start, end = self.standard_range
+        width = end - start
+        base = self.rng.uniform(250, 350) - scale * values.min()
+        
+        # Coeficientes em x (u = x / extensão, com a pista começando em x = 0),
+        # arredondados para 3 algarismos significativos: a fórmula exibida é
+        # exatamente a função avaliada
+        coeffs = [round(base)]
+        for i in range(1, degree + 1):
+            coeffs.append(float(f"{scale * shape[i] / width**i:.3g}"))
+        
+        # Polinômio avaliado na forma de Horner (ver utils/expression.py)
+        expr = poly(coeffs)
         
         # Gera a fórmula como string
-        formula_terms = []
-        for i, c in enumerate(coeffs):
-            if abs(c) < 0.00001 and i > 0:
-                continue  # Ignora termos muito pequenos
-                
-            if i == 0:  # Termo constante
-                formula_terms.append(f"{c:.0f}")
-            elif i == 1:  # Termo linear
-                coeff_str = f"{abs(c):.4f}".rstrip('0').rstrip('.')
-                formula_terms.append(f"{'+' if c > 0 else '-'} {coeff_str}x")
-            else:  # Termos de maior grau
-                coeff_str = f"{abs(c):.6f}".rstrip('0').rstrip('.')
-                formula_terms.append(f"{'+' if c > 0 else '-'} {coeff_str}x^{i}")
+        formula_terms = [f"{coeffs[0]:.0f}"]
+        for i, c in enumerate(coeffs[1:], start=1):
+            coeff_str = _format_coefficient(abs(c))
+            power = "x" if i == 1 else f"x^{i}"
+            formula_terms.append(f"{'+' if c > 0 else '-'} {coeff_str}{power}")
         
         formula = "f(x) = " + " ".join(formula_terms)
         
-        return {
-            "name": f"Polinômio Grau {degree}",
-            "formula": formula,
-            "f": f,
-            "df": df,
-            "d2f": d2f,
-            "range": self.standard_range,
-            "checkpoints": self.standard_checkpoints
-        }
+        return self._candidate(f"Polinômio Grau {degree}", formula, expr)
     
     def _generate_trigonometric(self, difficulty):
         """Gera uma função trigonométrica aleatória."""
         # Seleciona funções trigonométricas
         trig_funcs = [
-            ("sen", math.sin),
-            ("cos", math.cos)
+            ("sen", sin),
+            ("cos", cos)
         ]
         
-        # Seleciona parâmetros
-        amplitude = random.uniform(30, 70)
-        frequency = random.uniform(0.005, 0.02)
-        phase = random.uniform(0, 2*math.pi)
-        vertical_shift = random.uniform(250, 350)
+        # Seleciona parâmetros (arredondados como aparecem na fórmula, para
+        # que as respostas sejam as da função exibida)
+        amplitude = round(self.rng.uniform(30, 70))
+        frequency = round(self.rng.uniform(0.005, 0.02), 4)
+        phase = round(self.rng.uniform(0, 2*math.pi), 2)
+        vertical_shift = round(self.rng.uniform(250, 350))
         
         # Adiciona termos extras baseados na dificuldade
-        has_linear = difficulty >= 2 and random.random() > 0.5
-        has_quadratic = difficulty >= 3 and random.random() > 0.7
+        has_linear = difficulty >= 2 and self.rng.random() > 0.5
+        has_quadratic = difficulty >= 3 and self.rng.random() > 0.7
         
-        linear_term = random.uniform(0.001, 0.005) if has_linear else 0
-        quadratic_term = random.uniform(0.0001, 0.001) if has_quadratic else 0
+        linear_term = round(self.rng.uniform(0.001, 0.005), 4) if has_linear else 0
+        quadratic_term = round(self.rng.uniform(0.0001, 0.001), 6) if has_quadratic else 0
         
         # Seleciona função trigonométrica aleatória
-        trig_name, trig_func = random.choice(trig_funcs)
-        
-        # Cria as funções
-        def f(x):
-            return amplitude * trig_func(frequency * x + phase) + linear_term * x + quadratic_term * x**2 + vertical_shift
+        trig_name, trig_func = self.rng.choice(trig_funcs)
         
-        def df(x):
-            trig_deriv = math.cos if trig_name == "sen" else (lambda t: -math.sin(t))
-            return amplitude * frequency * trig_deriv(frequency * x + phase) + linear_term + 2 * quadratic_term * x
-        
-        def d2f(x):
-            trig_second_deriv = (lambda t: -math.sin(t)) if trig_name == "sen" else (lambda t: -math.cos(t))
-            return amplitude * frequency**2 * trig_second_deriv(frequency * x + phase) + 2 * quadratic_term
+        # Monta a árvore da expressão
+        expr = (amplitude * trig_func(frequency * X + phase) + linear_term * X
+                + quadratic_term * X**2 + vertical_shift)
         
         # Constrói a fórmula como string
         formula = f"f(x) = {amplitude:.0f}·{trig_name}({frequency:.4f}x"
@@ -161,39 +176,24 @@ class FunctionGenerator:
         
         formula += f" + {vertical_shift:.0f}"
         
-        return {
-            "name": f"Função {trig_name.capitalize()}oidal",
-            "formula": formula,
-            "f": f,
-            "df": df,
-            "d2f": d2f,
-            "range": self.standard_range,
-            "checkpoints": self.standard_checkpoints
-        }
+        return self._candidate(f"Função {trig_name.capitalize()}oidal", formula, expr)
     
     def _generate_exponential(self, difficulty):
         """Gera uma função exponencial aleatória."""
-        # Parâmetros base
-        amplitude = random.uniform(100, 400)
-        rate = random.uniform(0.001, 0.005)  # Taxa de crescimento
-        vertical_shift = random.uniform(100, 200)
+        # Parâmetros base (arredondados como aparecem na fórmula)
+        amplitude = round(self.rng.uniform(100, 400))
+        rate = round(self.rng.uniform(0.001, 0.005), 4)  # Taxa de crescimento
+        vertical_shift = round(self.rng.uniform(100, 200))
         
         # Ajustes baseados na dificuldade
-        is_negative = random.random() > 0.5
+        is_negative = self.rng.random() > 0.5
         if is_negative:
             rate = -rate
         
-        horizontal_shift = random.uniform(300, 700) if difficulty >= 2 else 0
-        
-        # Cria as funções
-        def f(x):
-            return amplitude * math.exp(rate * (x - horizontal_shift)) + vertical_shift
+        horizontal_shift = round(self.rng.uniform(300, 700)) if difficulty >= 2 else 0
         
-        def df(x):
-            return amplitude * rate * math.exp(rate * (x - horizontal_shift))
-        
-        def d2f(x):
-            return amplitude * rate**2 * math.exp(rate * (x - horizontal_shift))
+        # Monta a árvore da expressão
+        expr = amplitude * exp(rate * (X - horizontal_shift)) + vertical_shift
         
         # Constrói a fórmula
         formula = f"f(x) = {amplitude:.0f} · e^({rate:.4f}"
@@ -203,41 +203,25 @@ class FunctionGenerator:
             formula += "x"
         formula += f") + {vertical_shift:.0f}"
         
-        return {
-            "name": "Função Exponencial",
-            "formula": formula,
-            "f": f,
-            "df": df,
-            "d2f": d2f,
-            "range": self.standard_range,
-            "checkpoints": self.standard_checkpoints
-        }
+        return self._candidate("Função Exponencial", formula, expr)
     
     def _generate_logarithmic(self, difficulty):
         """Gera uma função logarítmica aleatória."""
-        # Parâmetros base
-        amplitude = random.uniform(50, 100)
-        vertical_shift = random.uniform(250, 350)
-        horizontal_shift = random.uniform(50, 150)
+        # Parâmetros base (arredondados como aparecem na fórmula)
+        amplitude = round(self.rng.uniform(50, 100))
+        vertical_shift = round(self.rng.uniform(250, 350))
+        horizontal_shift = round(self.rng.uniform(50, 150))
         
         # Adiciona termos extras baseados na dificuldade
-        linear_term = random.uniform(0.05, 0.2) if difficulty >= 2 else 0
-        
-        # Cria as funções (tratando domínio)
-        def f(x):
-            if x <= horizontal_shift:
-                return vertical_shift  # Evita logaritmo de número negativo ou zero
-            return amplitude * math.log(x - horizontal_shift + 1) + linear_term * x + vertical_shift
+        linear_term = round(self.rng.uniform(0.05, 0.2), 2) if difficulty >= 2 else 0
         
-        def df(x):
-            if x <= horizontal_shift:
-                return 0
-            return amplitude / (x - horizontal_shift + 1) + linear_term
-        
-        def d2f(x):
-            if x <= horizontal_shift:
-                return 0
-            return -amplitude / (x - horizontal_shift + 1)**2
+        # Monta a árvore da expressão (tratando domínio: antes do deslocamento
+        # a função é constante, evitando logaritmo de número negativo ou zero)
+        expr = where(
+            horizontal_shift,
+            vertical_shift,
+            amplitude * log(X - horizontal_shift + 1) + linear_term * X + vertical_shift
+        )
         
         # Constrói a fórmula
         formula = f"f(x) = {amplitude:.0f} · ln(x"
@@ -250,15 +234,7 @@ class FunctionGenerator:
             
         formula += f" + {vertical_shift:.0f}"
         
-        return {
-            "name": "Função Logarítmica",
-            "formula": formula,
-            "f": f,
-            "df": df,
-            "d2f": d2f,
-            "range": self.standard_range,
-            "checkpoints": self.standard_checkpoints
-        }
+        return self._candidate("Função Logarítmica", formula, expr)
     
     def _generate_composite(self, difficulty):
         """Gera uma função composta combinando diferentes tipos."""
@@ -266,9 +242,9 @@ class FunctionGenerator:
         available_types = ["polynomial", "trigonometric", "exponential", "logarithmic"]
         
         # Escolhe dois tipos diferentes de função
-        first_type = random.choice(available_types)
+        first_type = self.rng.choice(available_types)
         available_types.remove(first_type)
-        second_type = random.choice(available_types)
+        second_type = self.rng.choice(available_types)
         
         # Gera funções com complexidade reduzida
         reduced_difficulty = max(1, difficulty - 1)
@@ -276,29 +252,90 @@ class FunctionGenerator:
         second_func = self._generate_function_by_type(second_type, reduced_difficulty)
         
         # Pesos para a combinação
-        weight1 = random.uniform(0.3, 0.7)
-        weight2 = 1 - weight1
-        
-        # Cria a função composta
-        def f(x):
-            return weight1 * first_func["f"](x) + weight2 * second_func["f"](x)
+        weight1 = round(self.rng.uniform(0.3, 0.7), 2)
+        weight2 = round(1 - weight1, 2)
         
-        def df(x):
-            return weight1 * first_func["df"](x) + weight2 * second_func["df"](x)
-        
-        def d2f(x):
-            return weight1 * first_func["d2f"](x) + weight2 * second_func["d2f"](x)
+        # Cria a função composta combinando as árvores das funções base
+        expr = weight1 * first_func["expr"] + weight2 * second_func["expr"]
         
         # Constrói nome e fórmula
         name = f"Função Composta"
         formula = f"f(x) = {weight1:.2f}·({first_func['formula'][5:]}) + {weight2:.2f}·({second_func['formula'][5:]})"
         
+        return self._candidate(name, formula, expr)
+    
+    def _candidate(self, name, formula, expr):
+        """Candidato sorteado: só nome, fórmula e árvore (ver _build_function)."""
+        return {"name": name, "formula": formula, "expr": expr}
+    
+    def validate(self, jet_vec):
+        """
+        Verifica um candidato avaliando f, f' e f'' em uma grade densa.
+        
+        Args:
+            jet_vec (callable): Jet vetorizado da função (ver compile_jet)
+            
+        Returns:
+            list: Descrição dos critérios violados (vazia se a função é válida)
+        """
+        # Grade e checkpoints em uma única avaliação do jet
+        points = _validation_points(self.standard_range, self.standard_checkpoints)
+        y, dy, d2y = jet_vec(points)
+        if not (np.all(np.isfinite(y)) and np.all(np.isfinite(dy)) and np.all(np.isfinite(d2y))):
+            return ["valores não finitos"]
+        first, second = np.abs(dy[VALIDATION_SAMPLES:]), np.abs(d2y[VALIDATION_SAMPLES:])
+        y, dy, d2y = y[:VALIDATION_SAMPLES], dy[:VALIDATION_SAMPLES], d2y[:VALIDATION_SAMPLES]
+        
+        problems = []
+        if np.ptp(y) > MAX_HEIGHT_SPAN:
+            problems.append("altura fora dos limites")
+        if np.max(np.abs(dy)) > MAX_SLOPE:
+            problems.append("inclinação excessiva")
+        if np.max(np.abs(d2y)) < MIN_CURVATURE:
+            problems.append("f'' nula em toda a pista")
+        
+        # Respostas nos checkpoints (de primeira ou de segunda derivada)
+        if np.max(first) > MAX_FIRST_ANSWER or np.max(second) > MAX_SECOND_ANSWER:
+            problems.append("respostas fora do alcance")
+        # Qualquer checkpoint pode pedir f' ou f'' (depende da dificuldade do jogo)
+        if np.min(first) < MIN_FIRST_ANSWER or np.min(second) < MIN_SECOND_ANSWER:
+            problems.append("respostas praticamente nulas")
+        return problems
+    
+    def _build_function(self, name, formula, expr, jet_vec=None):
+        """
+        Monta o dicionário da função a partir da árvore da expressão.
+        
+        As derivadas são obtidas por derivação simbólica da árvore e todas as
+        versões (escalares e vetorizadas) são compiladas a partir dela.
+        "jet_vec" retorna (f, f', f'') sobre um array de uma vez, reaproveitando
+        as subexpressões comuns (ver compile_jet); é o que a pista e os
+        checkpoints usam. O jogo em si só avalia f escalar a cada passo.
+        
+        Args:
+            name (str): Nome da função
+            formula (str): Fórmula para exibição
+            expr (Expr): Árvore da expressão de f
+            jet_vec (callable, optional): Jet vetorizado já compilado na validação
+            
+        Returns:
+            dict: Dicionário contendo a função, derivadas e metadados.
+        """
+        if jet_vec is None:
+            jet_vec = compile_jet(expr, vectorized=True)
+        d_expr = expr.diff()
+        d2_expr = d_expr.diff()
         return {
             "name": name,
             "formula": formula,
-            "f": f,
-            "df": df,
-            "d2f": d2f,
+            "expr": expr,
+            "f": compile_expression(expr),
+            "df": compile_expression(d_expr),
+            "d2f": compile_expression(d2_expr),
+            "f_vec": compile_expression(expr, vectorized=True),
+            "df_vec": compile_expression(d_expr, vectorized=True),
+            "d2f_vec": compile_expression(d2_expr, vectorized=True),
+            "jet_vec": jet_vec,
             "range": self.standard_range,
             "checkpoints": self.standard_checkpoints
         }
@@ -330,12 +367,47 @@ class FunctionGenerator:
         """
         functions = []
         for _ in range(count):
-            difficulty = random.randint(difficulty_range[0], difficulty_range[1])
-            function_type = random.choice(self.function_types)
+            difficulty = self.rng.randint(difficulty_range[0], difficulty_range[1])
+            function_type = self.rng.choice(self.function_types)
             functions.append(self.generate_function(function_type, difficulty))
         return functions
 
 
+@lru_cache(maxsize=None)
+def _validation_points(track_range, checkpoint_count):
+    """Grade de validação seguida das posições dos checkpoints (ver validate)."""
+    start, end = track_range
+    spacing = (end - start) / (checkpoint_count + 1)
+    checkpoints = start + spacing * np.arange(1, checkpoint_count + 1)
+    return np.concatenate((np.linspace(start, end, VALIDATION_SAMPLES), checkpoints))
+
+
+def _format_coefficient(value):
+    """Escreve um coeficiente positivo sem notação científica (ex.: 0.00000032)."""
+    decimals = max(0, 2 - math.floor(math.log10(value)))
+    return f"{value:.{decimals}f}".rstrip('0').rstrip('.')
+
+
+def _vectorized_jet(jet):
+    """Adapta um jet escrito com NumPy para aceitar listas e escalares."""
+    return lambda x: jet(np.asarray(x, dtype=float))
+
+
+def _sinusoid_jet(x):
+    s = np.sin(0.01 * x)
+    return 50 * s + 0.001 * x**2 + 300, 0.5 * np.cos(0.01 * x) + 0.002 * x, -0.005 * s + 0.002
+
+
+def _logistic_jet(x):
+    e = np.exp(-0.01 * (x - 500))
+    r = 1 / (1 + e)
+    return 400 * r, 4 * e * r**2, -0.04 * e * (1 - e) * r**3
+
+
+def _cubic_jet(x):
+    return 0.0001 * x**3 - 0.08 * x**2 + 20 * x + 100, 0.0003 * x**2 - 0.16 * x + 20, 0.0006 * x - 0.16
+
+
 # Funções estáticas (originais do jogo)
 STATIC_FUNCTIONS = [
     {
@@ -344,8 +416,13 @@ STATIC_FUNCTIONS = [
         "f": lambda x: 50 * math.sin(0.01 * x) + 0.001 * x**2 + 300,
         "df": lambda x: 0.5 * math.cos(0.01 * x) + 0.002 * x,
         "d2f": lambda x: -0.005 * math.sin(0.01 * x) + 0.002,
+        "f_vec": lambda x: 50 * np.sin(0.01 * np.asarray(x, dtype=float)) + 0.001 * np.asarray(x, dtype=float)**2 + 300,
+        "df_vec": lambda x: 0.5 * np.cos(0.01 * np.asarray(x, dtype=float)) + 0.002 * np.asarray(x, dtype=float),
+        "d2f_vec": lambda x: -0.005 * np.sin(0.01 * np.asarray(x, dtype=float)) + 0.002,
+        "jet_vec": _vectorized_jet(_sinusoid_jet),
         "range": (0, 1000),
-        "checkpoints": 4
+        "checkpoints": 4,
+        "family": "static"
     },
     {
         "name": "Logística",
@@ -353,8 +430,13 @@ STATIC_FUNCTIONS = [
         "f": lambda x: 400 / (1 + math.exp(-0.01*(x - 500))),
         "df": lambda x: (4 * math.exp(-0.01*(x - 500))) / (1 + math.exp(-0.01*(x - 500)))**2,
         "d2f": lambda x: (-0.04 * math.exp(-0.01*(x-500)) * (1 - math.exp(-0.01*(x-500)))) / (1 + math.exp(-0.01*(x-500)))**3,
+        "f_vec": lambda x: 400 / (1 + np.exp(-0.01*(np.asarray(x, dtype=float) - 500))),
+        "df_vec": lambda x: (4 * np.exp(-0.01*(np.asarray(x, dtype=float) - 500))) / (1 + np.exp(-0.01*(np.asarray(x, dtype=float) - 500)))**2,
+        "d2f_vec": lambda x: (-0.04 * np.exp(-0.01*(np.asarray(x, dtype=float)-500)) * (1 - np.exp(-0.01*(np.asarray(x, dtype=float)-500)))) / (1 + np.exp(-0.01*(np.asarray(x, dtype=float)-500)))**3,
+        "jet_vec": _vectorized_jet(_logistic_jet),
         "range": (0, 1000),
-        "checkpoints": 4
+        "checkpoints": 4,
+        "family": "static"
     },
     {
         "name": "Polinômio Cúbico",
@@ -362,12 +444,47 @@ STATIC_FUNCTIONS = [
         "f": lambda x: 0.0001 * x**3 - 0.08 * x**2 + 20 * x + 100,
         "df": lambda x: 0.0003 * x**2 - 0.16 * x + 20,
         "d2f": lambda x: 0.0006 * x - 0.16,
+        "f_vec": lambda x: np.polyval([0.0001, -0.08, 20, 100], np.asarray(x, dtype=float)),
+        "df_vec": lambda x: np.polyval([0.0003, -0.16, 20], np.asarray(x, dtype=float)),
+        "d2f_vec": lambda x: np.polyval([0.0006, -0.16], np.asarray(x, dtype=float)),
+        "jet_vec": _vectorized_jet(_cubic_jet),
         "range": (0, 1000),
-        "checkpoints": 4
+        "checkpoints": 4,
+        "family": "static"
     }
 ]
 
-def get_functions(include_static=True, generated_count=3, difficulty_range=(1, 3)):
+def function_from_expr(name, formula, expr, scalar_only=False):
+    """
+    Monta o dicionário de uma função já conhecida (ex.: lida do cache).
+
+    Args:
+        name (str): Nome da função
+        formula (str): Fórmula para exibição
+        expr (Expr): Árvore da expressão de f
+        scalar_only (bool): Se True, compila só f, f' e f'' escalares (basta
+            ao jogo quando a pista e os checkpoints já foram calculados)
+
+    Returns:
+        dict: Dicionário da função, como os de FunctionGenerator
+    """
+    generator = FunctionGenerator()
+    if not scalar_only:
+        return generator._build_function(name, formula, expr)
+    d_expr = expr.diff()
+    return {
+        "name": name,
+        "formula": formula,
+        "expr": expr,
+        "f": compile_expression(expr),
+        "df": compile_expression(d_expr),
+        "d2f": compile_expression(d_expr.diff()),
+        "range": generator.standard_range,
+        "checkpoints": generator.standard_checkpoints,
+    }
+
+
+def get_functions(include_static=True, generated_count=3, difficulty_range=(1, 3), seed=None):
     """
     Obtém um conjunto de funções para o jogo, combinando funções estáticas e geradas.
     
@@ -375,6 +492,7 @@ def get_functions(include_static=True, generated_count=3, difficulty_range=(1, 3
         include_static (bool): Se deve incluir as funções estáticas predefinidas
         generated_count (int): Número de funções aleatórias a serem geradas
         difficulty_range (tuple): Intervalo de dificuldade para as funções geradas
+        seed (int, optional): Semente para gerar sempre o mesmo conjunto
         
     Returns:
         list: Lista de funções
@@ -387,7 +505,7 @@ def get_functions(include_static=True, generated_count=3, difficulty_range=(1, 3
     
     # Adiciona funções geradas aleatoriamente
     if generated_count > 0:
-        generator = FunctionGenerator()
+        generator = FunctionGenerator(seed)
         functions.extend(generator.generate_function_set(generated_count, difficulty_range))
     
     return functions
@@ -398,12 +516,12 @@ if __name__ == "__main__":
     generator = FunctionGenerator()
     
     print("Função Polinomial:")
-    poly = generator.generate_function("polynomial", 2)
-    print(poly["name"])
-    print(poly["formula"])
-    print(f"f(100) = {poly['f'](100)}")
-    print(f"f'(100) = {poly['df'](100)}")
-    print(f"f''(100) = {poly['d2f'](100)}")
+    polynomial = generator.generate_function("polynomial", 2)
+    print(polynomial["name"])
+    print(polynomial["formula"])
+    print(f"f(100) = {polynomial['f'](100)}")
+    print(f"f'(100) = {polynomial['df'](100)}")
+    print(f"f''(100) = {polynomial['d2f'](100)}")
     print()
     
     print("Função Trigonométrica:")
@@ -0,0 +1,221 @@
+import atexit
+import cProfile
+import gc
+import io
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+
+# =============================================
+# CAPTURA DE PERFIL (cProfile + tracemalloc)
+# =============================================
+# Perfila os próximos N quadros do jogo ou do menu e grava em CAPTURE_DIR:
+#   <tela>-<data>.pstats   tempos por função (abra com pstats ou snakeviz)
+#   <tela>-<data>.txt      funções mais caras, memória temporária por quadro,
+#                          alocações por arquivo:linha e pausas do coletor de
+#                          lixo durante a captura
+# A captura começa com F9 (no jogo ou no menu) ou, com
+# DERIVATIVE_DASH_PROFILE=N, automaticamente nos N primeiros quadros de cada
+# tela. Ex.: DERIVATIVE_DASH_PROFILE=600 python derivative_dash.py
+
+PROFILE_ENV = "DERIVATIVE_DASH_PROFILE"
+DEFAULT_CAPTURE_FRAMES = 300  # Quadros capturados por F9 sem DERIVATIVE_DASH_PROFILE
+CAPTURE_DIR = os.environ.get("DERIVATIVE_DASH_CAPTURE_DIR", "captures")
+TRACEBACK_DEPTH = 1   # Quadros de pilha guardados por alocação (só arquivo:linha)
+TOP_ALLOCATIONS = 30  # Linhas de cada lista do relatório
+TOP_FUNCTIONS = 30
+
+_active = set()          # Capturas em andamento (finalizadas ao sair do jogo)
+_auto_started = set()    # Telas já capturadas por DERIVATIVE_DASH_PROFILE
+
+
+class FrameCapture:
+    """
+    Perfil de CPU e de alocações de um número fixo de quadros de uma tela.
+
+    A tela chama frame() uma vez por iteração do seu loop e stop() ao sair;
+    a captura termina sozinha depois do número de quadros pedido.
+    """
+
+    def __init__(self, label, frames=None, directory=CAPTURE_DIR):
+        """
+        Args:
+            label (str): Nome da tela, usado nos nomes dos arquivos ("game", "menu")
+            frames (int, optional): Quadros por captura (padrão: DERIVATIVE_DASH_PROFILE
+                ou DEFAULT_CAPTURE_FRAMES)
+            directory (str): Diretório dos arquivos (DERIVATIVE_DASH_CAPTURE_DIR)
+        """
+        self.label = label
+        self.requested = _requested_frames()
+        self.frames = frames or self.requested or DEFAULT_CAPTURE_FRAMES
+        self.directory = directory
+        self.remaining = 0
+        self.profiler = None
+
+    @property
+    def active(self):
+        return self.profiler is not None
+
+    def start_if_requested(self):
+        """Inicia a captura automática (DERIVATIVE_DASH_PROFILE), uma vez por tela."""
+        if self.requested and self.label not in _auto_started:
+            _auto_started.add(self.label)
+            self.start()
+
+    def start(self):
+        """Começa a capturar os próximos quadros (ignorado se já estiver capturando)."""
+        if self.active:
+            return
+        self.remaining = self.frames
+        self.captured = 0
+        self._gc_pauses = {0: [], 1: [], 2: []}
+        self._gc_start = None
+        gc.callbacks.append(self._on_gc)
+        self._own_tracemalloc = not tracemalloc.is_tracing()
+        if self._own_tracemalloc:
+            tracemalloc.start(TRACEBACK_DEPTH)
+        self._first_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        # Memória no início do quadro e, por quadro, o pico acima dela (memória
+        # temporária, liberada antes do fim do quadro) e o crescimento líquido
+        self._frame_base = tracemalloc.get_traced_memory()[0]
+        self._frame_peaks = []
+        self._frame_growth = []
+        self._peak = 0
+        self.started_at = time.perf_counter()
+        self.profiler = cProfile.Profile()
+        _active.add(self)
+        self.profiler.enable()
+
+    def frame(self):
+        """Conta um quadro; finaliza a captura quando os quadros acabam."""
+        if self.profiler is None:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self._frame_peaks.append(peak - self._frame_base)
+        self._frame_growth.append(current - self._frame_base)
+        self._frame_base = current
+        self._peak = max(self._peak, peak)
+        self.captured += 1
+        self.remaining -= 1
+        if self.remaining <= 0:
+            return self.stop()
+        return None
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self._gc_pauses[info["generation"]].append(time.perf_counter() - self._gc_start)
+            self._gc_start = None
+
+    def stop(self):
+        """
+        Finaliza a captura e grava os arquivos.
+
+        Returns:
+            tuple: Caminhos (pstats, relatório), ou None se não havia captura
+        """
+        if self.profiler is None:
+            return None
+        self.profiler.disable()
+        elapsed = time.perf_counter() - self.started_at
+        snapshot = tracemalloc.take_snapshot()
+        peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+        if self._own_tracemalloc:
+            tracemalloc.stop()
+        gc.callbacks.remove(self._on_gc)
+        _active.discard(self)
+
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f"{self.label}-{time.strftime('%Y%m%d-%H%M%S')}")
+        stats_path, report_path = base + ".pstats", base + ".txt"
+        self.profiler.dump_stats(stats_path)
+        with open(report_path, "w", encoding="utf-8") as file:
+            file.write(self._report(snapshot, peak, elapsed))
+        self.profiler = None
+        print(f"Captura gravada: {stats_path} e {report_path}", file=sys.stderr)
+        return stats_path, report_path
+
+    def _report(self, snapshot, peak, elapsed):
+        """Relatório em texto: resumo, pausas do GC, alocações e funções mais caras."""
+        frames = max(self.captured, 1)
+        lines = [
+            f"Captura '{self.label}': {self.captured} quadros em {elapsed:.2f} s "
+            f"({elapsed / frames * 1000:.2f} ms por quadro)",
+            f"Pico de memória rastreada: {peak / 1024:.0f} KiB",
+        ]
+        # O pico de cada quadro acima da memória do seu início mostra o que é
+        # alocado e liberado no mesmo quadro, que as listas de arquivo:linha
+        # abaixo (só memória ainda viva) não mostram
+        if self._frame_peaks:
+            peaks = sorted(self._frame_peaks)
+            lines += [
+                f"Memória temporária por quadro: média {sum(peaks) / len(peaks) / 1024:.1f} KiB, "
+                f"mediana {peaks[len(peaks) // 2] / 1024:.1f} KiB, máxima {peaks[-1] / 1024:.1f} KiB",
+                f"Crescimento por quadro: média {sum(self._frame_growth) / len(self._frame_growth) / 1024:+.2f} KiB",
+            ]
+        lines += [
+            "",
+            "Coletas do GC (geração: coletas, por quadro, pausa total, pausa máxima):",
+        ]
+        for generation, pauses in self._gc_pauses.items():
+            total = sum(pauses) * 1000
+            longest = max(pauses, default=0) * 1000
+            lines.append(
+                f"  {generation}: {len(pauses)}, {len(pauses) / frames:.2f}, {total:.2f} ms, {longest:.2f} ms"
+            )
+
+        # Alocações do próprio tracemalloc e do import não interessam
+        ignored = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+        snapshot = snapshot.filter_traces(ignored)
+        first = self._first_snapshot.filter_traces(ignored)
+
+        lines += ["", "Crescimento da memória durante a captura (arquivo:linha):"]
+        for stat in snapshot.compare_to(first, "lineno")[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocos  {frame.filename}:{frame.lineno}"
+            )
+
+        lines += ["", "Memória em uso no fim da captura (arquivo:linha):"]
+        for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            lines.append(f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocos  {frame.filename}:{frame.lineno}")
+
+        # Número de chamadas revela objetos recriados a cada quadro (superfícies, fontes, listas)
+        for title, key in (("tempo próprio", "tottime"), ("número de chamadas", "ncalls")):
+            stream = io.StringIO()
+            pstats.Stats(self.profiler, stream=stream).sort_stats(key).print_stats(TOP_FUNCTIONS)
+            lines += ["", f"Funções por {title}:", stream.getvalue()]
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _requested_frames():
+    """Quadros pedidos em DERIVATIVE_DASH_PROFILE (None se não definido)."""
+    value = os.environ.get(PROFILE_ENV)
+    if not value:
+        return None
+    try:
+        frames = int(value)
+    except ValueError:
+        print(f"{PROFILE_ENV}={value!r} inválido; capturando {DEFAULT_CAPTURE_FRAMES} quadros", file=sys.stderr)
+        return DEFAULT_CAPTURE_FRAMES
+    return frames if frames > 0 else None
+
+
+def _stop_all():
+    for capture in list(_active):
+        capture.stop()
+
+
+atexit.register(_stop_all)
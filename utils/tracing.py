@@ -0,0 +1,165 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+
+# =============================================
+# RASTREAMENTO (CHROME TRACE / PERFETTO)
+# =============================================
+# Registra intervalos (etapas do quadro, lógica do jogo, desenho) e eventos
+# instantâneos (checkpoint alcançado, resposta enviada, batida) em um buffer
+# pré-alocado, gravado como JSON do Chrome ao sair do jogo. Uso:
+#   DERIVATIVE_DASH_TRACE=rastro.json python derivative_dash.py
+# e abra o arquivo em https://ui.perfetto.dev ou chrome://tracing.
+#
+# Desligado (padrão), traced() devolve a própria função e span()/instant()
+# não registram nada, então os pontos de medição podem ficar no código.
+
+TRACE_PATH = os.environ.get("DERIVATIVE_DASH_TRACE")
+ENABLED = bool(TRACE_PATH)
+CAPACITY = 1_000_000  # Eventos guardados; ao encher, os mais antigos são sobrescritos
+
+
+class Tracer:
+    """Buffer circular de eventos no formato do Chrome trace."""
+
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        # Cada evento: (fase, nome, início em ns, duração em ns, thread, argumentos)
+        self.events = [None] * capacity
+        self._counter = itertools.count()  # next() é atômico com o GIL
+        self.origin = time.perf_counter_ns()
+
+    def complete(self, name, start_ns, end_ns, args=None):
+        """Registra um intervalo já terminado."""
+        i = next(self._counter) % self.capacity
+        self.events[i] = ("X", name, start_ns, end_ns - start_ns, threading.get_ident(), args)
+
+    def instant(self, name, args=None):
+        """Registra um evento pontual."""
+        i = next(self._counter) % self.capacity
+        self.events[i] = ("i", name, time.perf_counter_ns(), 0, threading.get_ident(), args)
+
+    def to_chrome(self):
+        """
+        Converte o buffer para o formato JSON do Chrome trace.
+
+        Returns:
+            dict: {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        pid = os.getpid()
+        recorded = [event for event in self.events if event is not None]
+        recorded.sort(key=lambda event: event[2])
+        trace_events = []
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for tid in {event[4] for event in recorded}:
+            trace_events.append({
+                "ph": "M", "name": "thread_name", "pid": pid, "tid": tid,
+                "args": {"name": thread_names.get(tid, str(tid))},
+            })
+        for phase, name, start_ns, duration_ns, tid, args in recorded:
+            event = {
+                "ph": phase, "name": name, "pid": pid, "tid": tid,
+                "ts": (start_ns - self.origin) / 1000,
+            }
+            if phase == "X":
+                event["dur"] = duration_ns / 1000
+            else:
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome(), file, default=str)
+
+
+class _Span:
+    """Gerenciador de contexto que registra o intervalo ao sair."""
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        _tracer.complete(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+class _NullSpan:
+    """Substituto de _Span quando o rastreamento está desligado."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_tracer = Tracer() if ENABLED else None
+
+
+def span(name, **args):
+    """
+    Intervalo medido com um bloco with.
+
+    Exemplo:
+        with span("frame"):
+            ...
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(name, args or None)
+
+
+def instant(name, **args):
+    """Evento pontual (ex.: instant("crash", x=420))."""
+    if _tracer is not None:
+        _tracer.instant(name, args or None)
+
+
+def traced(name=None):
+    """
+    Decorador que registra cada chamada da função como um intervalo.
+
+    Com o rastreamento desligado a função é devolvida sem alterações.
+
+    Args:
+        name (str, optional): Nome do intervalo (padrão: nome qualificado da função)
+    """
+    def decorator(func):
+        if _tracer is None:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _tracer.complete(label, start, time.perf_counter_ns())
+        return wrapper
+    return decorator
+
+
+def flush(path=None):
+    """Grava o rastro em path (padrão: DERIVATIVE_DASH_TRACE)."""
+    if _tracer is not None:
+        _tracer.write(path or TRACE_PATH)
+
+
+if ENABLED:
+    atexit.register(flush)